@@ -0,0 +1,348 @@
+import argparse
+import concurrent.futures
+import contextlib
+import fnmatch
+import hashlib
+import json
+import pathlib
+import sqlite3
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+from buildtools import fonts
+
+
+HERE = pathlib.Path(__file__).resolve().parent
+STATE_FILE = HERE / '.cache' / 'build-state.json'
+
+# stylesheets inlined into every generated page (see buildtools/styles.py)
+SHARED_CSS = ('styles/base-style.css', 'fonts/fonts.css')
+
+
+class Target:
+    def __init__(
+        self,
+        name: str,
+        command: Sequence[str],  # script (relative to HERE) and its arguments
+        inputs: Sequence[str],  # glob patterns, relative to HERE
+        outputs: Sequence[str],  # paths, relative to HERE
+    ):
+        self.name = name
+        self.command = command
+        self.inputs = inputs
+        self.outputs = outputs
+
+    def input_files(self) -> List[pathlib.Path]:
+        return sorted({p for pattern in self.inputs for p in HERE.glob(pattern) if p.is_file()})
+
+    def rewrites_inputs(self) -> bool:
+        return any(fnmatch.fnmatchcase(out, pattern) for out in self.outputs for pattern in self.inputs)
+
+    def digest(self) -> str:
+        """ Hash of the command and the name and contents of every input file. """
+        h = hashlib.sha256()
+        h.update(json.dumps(list(self.command)).encode())
+        for path in self.input_files():
+            h.update(str(path.relative_to(HERE)).encode() + b'\0')
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+        return h.hexdigest()
+
+    def run(self) -> subprocess.CompletedProcess:
+        script, *args = self.command
+        return subprocess.run((sys.executable, HERE / script, *args), capture_output=True, text=True)
+
+
+def trophy_folders() -> List[str]:
+    with contextlib.closing(sqlite3.connect(HERE / 'trophies' / 'trophies.db')) as conn:
+        return [folder for folder, in conn.execute('SELECT FolderName FROM GAMELOOKUP;')]
+
+
+def trophy_pages() -> List[str]:
+    """ trophies.html in every game folder, plus a page per profile and a comparison once there are profiles. """
+    profiles = sorted(p.stem for p in HERE.glob('trophies/profiles/*.db'))
+    names = ['trophies.html', *(f'trophies-{name}.html' for name in profiles)]
+    if profiles:
+        names.append('trophies-compare.html')
+    return [f'{folder}/{name}' for folder in trophy_folders() for name in names]
+
+
+def declare_targets(convert: Optional[str] = None) -> Dict[str, Target]:
+    image_dirs = sorted(str(p.relative_to(HERE)) for p in HERE.glob('*/imgs'))
+    targets = [
+        Target(
+            'images',
+            command=['buildtools/images.py'],
+            inputs=[*(f'{d}/*.png' for d in image_dirs), 'buildtools/images.py'],
+            outputs=[f'{d}/sized/manifest.json' for d in image_dirs],
+        ),
+        Target(
+            'trophies',
+            command=['trophies/trophy_builder.py'],
+            inputs=['trophies/trophies.db', 'trophies/profiles/*.db', 'trophies/trophy_builder.py', 'trophies/*.png',
+                    'buildtools/*.py', '*/imgs/sized/manifest.json', *SHARED_CSS, 'styles/trophies.css',
+                    'styles/w3-subset.css'],
+            outputs=[*trophy_pages(), 'styles/trophy-icons.css'],
+        ),
+        Target(
+            'data',
+            command=['mka/htmlify.py', 'data'],
+            inputs=['mka/mkdata.db', 'mka/htmlify.json', 'mka/htmlify.py', 'buildtools/*.py', *SHARED_CSS,
+                    'styles/trophies.css', 'mka/style.css'],
+            outputs=['mka/data.html'],
+        ),
+        Target(
+            'character-quests',
+            command=['mka/htmlify.py', 'character-quests'],
+            inputs=[
+                'mka/mkdata.db', 'mka/htmlify.json', 'mka/htmlify.py', 'mka/imgs/sized/manifest.json', 'buildtools/*.py',
+                *SHARED_CSS, 'styles/trophies.css', 'mka/style.css',
+            ],
+            outputs=['mka/character-quests.html'],
+        ),
+        Target(
+            'deconstruction',
+            command=['mka/htmlify.py', 'deconstruction'],
+            # the page is edited in place, so it is its own source
+            inputs=['mka/deconstruction.html', 'mka/htmlify.py', 'mka/highlight.py', 'buildtools/*.py', *SHARED_CSS,
+                    'mka/style.css', 'mka/highlight.css'],
+            outputs=['mka/deconstruction.html'],
+        ),
+        Target(
+            'poems',
+            command=['hfa/poem_builder.py'],
+            inputs=['hfa/poems/*.txt', 'hfa/poem_builder.py', 'hfa/poem_helpers.py', 'buildtools/*.py', *SHARED_CSS,
+                    'hfa/style.css'],
+            outputs=['hfa/home.html'],
+        ),
+    ]
+
+    # fonts/ only exists once `buildtools/fonts.py --fetch` has vendored them; the subsets are cut to the
+    # text of the pages, so this runs after them (the pages only need fonts.css, which --fetch writes)
+    faces = fonts.vendored_faces()
+    if faces:
+        targets.append(Target(
+            'fonts',
+            command=['buildtools/fonts.py'],
+            inputs=['buildtools/fonts.py', 'fonts/src/*.woff2', *fonts.PAGES],
+            outputs=[f'fonts/{face.name}.woff2' for face in faces],
+        ))
+
+    # the AFS archives aren't kept in the repository, so only extract the ones that are present
+    archives = sorted(str(p.relative_to(HERE)) for p in HERE.glob('mka/audio/*.[aA][fF][sS]'))
+    if archives:
+        targets.append(Target(
+            'afs',
+            command=['mka/afs_extract.py', *archives, *(['--convert', convert] if convert else [])],
+            inputs=[*archives, 'mka/afs_extract.py', 'buildtools/*.py'],
+            outputs=[],
+        ))
+        targets.append(Target(
+            'stream-headers',
+            command=['mka/afs_extract.py', '--scan', *archives],
+            inputs=[*archives, 'mka/afs_extract.py'],
+            outputs=['mka/mkdata.db'],
+        ))
+
+    return {t.name: t for t in targets}
+
+
+def dependencies(targets: Dict[str, Target]) -> Dict[str, List[str]]:
+    """ Target A depends on target B when one of A's input patterns matches one of B's outputs.
+    Patterns are matched against the declared outputs, so this holds before B has ever run.
+    """
+    return {
+        t.name: sorted({
+            other.name
+            for other in targets.values() if other is not t
+            for out in other.outputs
+            if any(fnmatch.fnmatchcase(out, pattern) for pattern in t.inputs)
+        })
+        for t in targets.values()
+    }
+
+
+def select(deps: Dict[str, List[str]], wanted: Sequence[str]) -> List[str]:
+    """ The wanted targets and everything they (transitively) depend on, dependencies first. """
+    order: List[str] = []
+
+    def visit(name, path=()):
+        if name in path:
+            raise ValueError(f'Dependency cycle: {" -> ".join(path + (name,))}')
+        if name in order:
+            return
+        for dep in deps[name]:
+            visit(dep, path + (name,))
+        order.append(name)
+
+    for name in wanted:
+        visit(name)
+    return order
+
+
+def load_state() -> dict:
+    try:
+        return json.loads(STATE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state: dict):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    STATE_FILE.write_text(json.dumps(state, indent=4))
+
+
+def critical_path(order: List[str], deps: Dict[str, List[str]], durations: Dict[str, float]):
+    """ The chain of dependent targets with the largest total duration. """
+    finish: Dict[str, float] = {}
+    via: Dict[str, Optional[str]] = {}
+    for name in order:
+        before = max(deps[name], key=lambda d: finish[d], default=None)
+        finish[name] = durations.get(name, 0.0) + (finish[before] if before else 0.0)
+        via[name] = before
+
+    end = max(order, key=lambda n: finish[n], default=None)
+    path = []
+    while end is not None:
+        path.append(end)
+        end = via[end]
+    return path[::-1]
+
+
+def build(targets: Dict[str, Target], wanted: Sequence[str], jobs: int = 0, force: bool = False) -> bool:
+    deps = dependencies(targets)
+    order = select(deps, wanted)
+    state = load_state()
+
+    durations: Dict[str, float] = {}
+    status: Dict[str, str] = {}
+    digests: Dict[str, str] = {}
+    ok = True
+
+    def run(name: str):
+        target = targets[name]
+        start = time.perf_counter()
+        result = target.run()
+        return result, time.perf_counter() - start
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs or None) as pool:
+        pending: Dict[concurrent.futures.Future, str] = {}
+        waiting = list(order)
+
+        while waiting or pending:
+            # start every target whose dependencies have all finished
+            for name in list(waiting):
+                if any(dep not in status for dep in deps[name]):
+                    continue
+                waiting.remove(name)
+
+                if any(status[dep] == 'failed' for dep in deps[name]):
+                    status[name] = 'failed'
+                    continue
+
+                # dependencies have already been rebuilt at this point, so the digest sees their new outputs
+                digests[name] = targets[name].digest()
+                fresh = all((HERE / out).exists() for out in targets[name].outputs)
+                if not force and fresh and state.get(name) == digests[name]:
+                    status[name] = 'up to date'
+                    continue
+
+                pending[pool.submit(run, name)] = name
+
+            if not pending:
+                continue
+
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                result, durations[name] = future.result()
+                if result.returncode:
+                    ok = False
+                    status[name] = 'failed'
+                    sys.stderr.write(f'[{name}] failed with exit code {result.returncode}\n{result.stderr}')
+                else:
+                    status[name] = 'built'
+                    if targets[name].rewrites_inputs():
+                        # otherwise the next build would see its own output as a changed input
+                        digests[name] = targets[name].digest()
+                    state[name] = digests[name]
+                    save_state(state)
+
+    elapsed = time.perf_counter() - started
+
+    width = max(map(len, order), default=0)
+    for name in order:
+        took = f'{durations[name]:8.2f}s' if name in durations else ' ' * 9
+        print(f'{name:<{width}}  {took}  {status[name]}')
+
+    if durations:
+        path = critical_path(order, deps, durations)
+        total = sum(durations.get(name, 0.0) for name in path)
+        print(f'critical path: {" -> ".join(path)} ({total:.2f}s of {elapsed:.2f}s wall)')
+    else:
+        print('everything is up to date')
+
+    return ok
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'targets',
+        nargs='*', metavar='target',
+        help='the targets to build, along with their dependencies (default: all of them)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int, default=0,
+        help='maximum number of targets to run at once (default: one per CPU)'
+    )
+    parser.add_argument(
+        '-f', '--force',
+        action='store_true',
+        help='rebuild targets even when their inputs have not changed'
+    )
+    parser.add_argument(
+        '-c', '--convert',
+        help='passed on to afs_extract.py for any AFS archives in mka/audio'
+    )
+    parser.add_argument(
+        '-l', '--list',
+        action='store_true',
+        help='list the targets with their inputs and outputs, then exit'
+    )
+
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error(f'--jobs must be 0 (one per CPU) or more, not {args.jobs}')
+
+    return args
+
+
+def main(argv=None):
+    args = parse_command_line(argv)
+    targets = declare_targets(convert=args.convert)
+
+    if args.list:
+        deps = dependencies(targets)
+        for t in targets.values():
+            print(f'{t.name}:')
+            print(f'    inputs:  {", ".join(t.inputs)}')
+            print(f'    outputs: {", ".join(t.outputs) or "-"}')
+            print(f'    after:   {", ".join(deps[t.name]) or "-"}')
+        return
+
+    for name in args.targets:
+        if name not in targets:
+            sys.exit(f'Unknown target {name!r}; choose from {", ".join(targets)}')
+
+    if not build(targets, args.targets or list(targets), jobs=args.jobs, force=args.force):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
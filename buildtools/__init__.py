@@ -0,0 +1 @@
+""" Helpers shared by the page generators in trophies/, mka/ and hfa/. """
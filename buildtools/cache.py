@@ -0,0 +1,46 @@
+""" Results from previous builds, kept in a JSON file under a version hash.
+
+The version is a hash of whatever produced the results (the generator's own source, usually), so
+editing that code discards the whole cache rather than serving results it would no longer produce.
+"""
+import json
+import pathlib
+from typing import Any, Dict, Optional
+
+
+class BuildCache:
+    def __init__(self, path: pathlib.Path, version: str):
+        self.path = path
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Any] = {}
+        self._used: Dict[str, Any] = {}
+
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == version:
+            self._entries = data.get('entries', {})
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._used[key] = value
+        return value
+
+    def put(self, key: str, value: Any):
+        self._used[key] = value
+
+    def save(self, prune: bool = True):
+        """ Write the cache back. With `prune`, only what this build used is kept, so results for
+        deleted inputs don't accumulate; without it, entries this build didn't look at survive.
+        """
+        entries = self._used if prune else {**self._entries, **self._used}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({'version': self.version, 'entries': entries}))
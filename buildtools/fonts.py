@@ -0,0 +1,204 @@
+""" Self-hosted copies of the web fonts the pages use, cut down to the text they actually contain.
+
+`python buildtools/fonts.py --fetch` downloads the Google Fonts stylesheet for FAMILIES and every
+font file it references into fonts/src/, and writes fonts/fonts.css pointing at local copies. Those
+are committed, so only that step needs the network.
+
+`python buildtools/fonts.py` then writes fonts/<name>.woff2 from each source, subset to the
+characters that occur in the generated pages. fontTools (with brotli, for WOFF2) is optional:
+without it the sources are copied unchanged, and since Google splits every family into files by
+unicode-range, a browser still only downloads the ranges a page uses.
+"""
+import argparse
+import collections
+import html
+import io
+import pathlib
+import re
+import string
+import sys
+import urllib.request
+from typing import Dict, Iterable, List, Set, Tuple
+
+if __package__:
+    from . import output
+else:
+    # run directly as buildtools/fonts.py
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+    from buildtools import output
+
+try:
+    import brotli  # noqa: F401 (fontTools needs it to read and write WOFF2)
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    subset = TTFont = None
+
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+FONTS_DIR = ROOT / 'fonts'
+SOURCE_DIR = FONTS_DIR / 'src'
+FONTS_CSS = FONTS_DIR / 'fonts.css'
+
+FAMILIES = ('Montserrat', 'Tangerine')
+CSS_URL = 'https://fonts.googleapis.com/css2?{families}&display=swap'
+# Google serves WOFF2 only to browsers it knows support it
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+
+# the generated pages whose text the fonts are subset to
+PAGES = ('*/trophies*.html', 'mka/*.html', 'hfa/home.html', 'hfa/pages/*.html')
+
+# a face from fonts.css: `name` is the file name without its extension
+FontFace = collections.namedtuple('FontFace', ('family', 'name', 'ranges'))
+
+
+def parse_ranges(text: str) -> List[Tuple[int, int]]:
+    """ "U+0000-00FF, U+0131" -> [(0x0000, 0x00FF), (0x0131, 0x0131)] """
+    ranges = []
+    for part in text.split(','):
+        low, _, high = part.strip()[2:].partition('-')
+        ranges.append((int(low, 16), int(high or low, 16)))
+    return ranges
+
+
+def _declarations(body: str) -> Dict[str, str]:
+    """ The property: value pairs of a CSS rule body. """
+    return {
+        key.strip().lower(): value.strip()
+        for key, _, value in (decl.partition(':') for decl in body.split(';') if ':' in decl)
+    }
+
+
+def parse_font_faces(css: str) -> List[FontFace]:
+    faces = []
+    for body in re.findall(r'@font-face\s*{([^}]*)}', css):
+        props = _declarations(body)
+        url = re.search(r'url\(([^)]*)\)', props['src']).group(1).strip('\'"')
+        ranges = parse_ranges(props['unicode-range']) if 'unicode-range' in props else [(0, 0x10FFFF)]
+        faces.append(FontFace(props['font-family'].strip('\'"'), pathlib.PurePosixPath(url).stem, ranges))
+    return faces
+
+
+def vendored_faces() -> List[FontFace]:
+    try:
+        return parse_font_faces(FONTS_CSS.read_text())
+    except OSError:
+        return []
+
+
+def _download(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def fetch(families: Iterable[str] = FAMILIES):
+    """ Download the families' font files into SOURCE_DIR and write FONTS_CSS for them. """
+    query = '&'.join(f'family={family.replace(" ", "+")}' for family in families)
+    css = _download(CSS_URL.format(families=query)).decode('utf-8')
+    SOURCE_DIR.mkdir(parents=True, exist_ok=True)
+
+    rules = ['/* generated by buildtools/fonts.py --fetch; do not edit */']
+    # Google labels each face with the subset it covers, e.g. /* latin-ext */
+    for subset_name, body in re.findall(r'/\*\s*([\w-]+)\s*\*/\s*@font-face\s*{([^}]*)}', css):
+        props = _declarations(body)
+        family = props['font-family'].strip('\'"')
+        url = re.search(r'url\(([^)]*)\)', props['src']).group(1).strip('\'"')
+        name = '-'.join((
+            family.lower().replace(' ', '-'), props.get('font-style', 'normal'),
+            props.get('font-weight', '400'), subset_name,
+        ))
+
+        output.write(SOURCE_DIR / f'{name}.woff2', _download(url))
+        rules.append(
+            f"@font-face {{ font-family: '{family}'; font-style: {props.get('font-style', 'normal')}; "
+            f"font-weight: {props.get('font-weight', '400')}; font-display: swap; "
+            f"src: url({name}.woff2) format('woff2'); unicode-range: {props['unicode-range']}; }}"
+        )
+
+    output.write(FONTS_CSS, '\n'.join(rules) + '\n')
+
+
+def used_codepoints(patterns: Iterable[str] = PAGES) -> Set[int]:
+    """ Every character in the text of the generated pages, plus printable ASCII. """
+    chars = set(string.printable)
+    for page in sorted({p for pattern in patterns for p in ROOT.glob(pattern)}):
+        text = page.read_text(encoding='utf-8')
+        text = re.sub(r'<(script|style)\b.*?</\1>', ' ', text, flags=re.S | re.I)
+        chars.update(html.unescape(re.sub(r'<[^>]*>', ' ', text)))
+    return {ord(c) for c in chars}
+
+
+def subset_font(source: pathlib.Path, codepoints: Set[int]) -> bytes:
+    font = TTFont(source)
+    options = subset.Options()
+    options.flavor = 'woff2'
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+
+    buf = io.BytesIO()
+    font.save(buf)
+    return buf.getvalue()
+
+
+def build(faces: List[FontFace], codepoints: Set[int]) -> Dict[str, int]:
+    """ Write FONTS_DIR/<name>.woff2 for every face, returning each file's size. """
+    sizes = {}
+    for face in faces:
+        source = SOURCE_DIR / f'{face.name}.woff2'
+        wanted = {c for c in codepoints if any(low <= c <= high for low, high in face.ranges)}
+
+        # a face none of the text falls in is never downloaded, so there's nothing to gain from it
+        if subset is not None and wanted:
+            data = subset_font(source, wanted)
+        else:
+            data = source.read_bytes()
+
+        output.write(FONTS_DIR / f'{face.name}.woff2', data)
+        sizes[face.name] = len(data)
+
+    # remove files for faces that are no longer in fonts.css
+    keep = {f'{face.name}.woff2' for face in faces}
+    for stale in FONTS_DIR.glob('*.woff2'):
+        if stale.name not in keep:
+            stale.unlink()
+
+    return sizes
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--fetch',
+        action='store_true',
+        help=f'download {", ".join(FAMILIES)} from Google Fonts into {SOURCE_DIR.relative_to(ROOT)} first'
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_command_line(argv)
+
+    if args.fetch:
+        try:
+            fetch()
+        except OSError as e:
+            sys.exit(f'Could not download the fonts: {e}')
+
+    faces = vendored_faces()
+    if not faces:
+        sys.exit(f'No fonts vendored yet; run {pathlib.Path(__file__).name} --fetch first.')
+    if subset is None:
+        sys.stderr.write('fontTools (with brotli) is not installed; copying the fonts without subsetting.\n')
+
+    sizes = build(faces, used_codepoints())
+    for name, size in sizes.items():
+        source = (SOURCE_DIR / f'{name}.woff2').stat().st_size
+        print(f'{name}: {size:,} bytes (from {source:,})')
+    print(output.summary())
+
+
+if __name__ == '__main__':
+    main()
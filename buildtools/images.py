@@ -0,0 +1,231 @@
+""" Resized, recompressed variants of the site's local images, and <img> markup that uses them.
+
+`python buildtools/images.py` writes the variants for every */imgs directory into imgs/sized/,
+along with a manifest.json recording each source's hash, dimensions and variants. Sources whose
+hash hasn't changed are skipped. The generators then call img_tag(), which reads the manifest to
+emit srcset/sizes and explicit dimensions.
+
+Pillow is optional: without it, the manifest still records every image's dimensions (read from
+the PNG header), so pages get width/height attributes, just no srcset.
+"""
+import argparse
+import concurrent.futures
+import functools
+import hashlib
+import html
+import json
+import pathlib
+import posixpath
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+if __package__:
+    from . import output
+else:
+    # run directly as buildtools/images.py
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+    from buildtools import output
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = features = None
+
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+VARIANT_DIR = 'sized'
+MANIFEST_NAME = 'manifest.json'
+
+# widths to generate below the source's own; it is also recompressed at full width
+LADDER = (64, 128, 256, 512)
+# bump when _make_variants changes what it writes, so existing variants are rebuilt
+VARIANTS_VERSION = 2
+
+
+def png_size(path: pathlib.Path) -> Optional[Tuple[int, int]]:
+    """ (width, height) from a PNG's IHDR chunk, without decoding the image. """
+    with open(path, 'rb') as f:
+        head = f.read(24)
+    if len(head) < 24 or head[:8] != b'\x89PNG\r\n\x1a\n' or head[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', head[16:24])
+
+
+def variant_format() -> str:
+    return 'webp' if features is not None and features.check('webp') else 'png'
+
+
+def _save(img, path: pathlib.Path, fmt: str):
+    if fmt == 'webp':
+        img.save(path, 'WEBP', quality=85, method=6)
+    else:
+        img.save(path, 'PNG', optimize=True)
+
+
+def _make_variants(source: str, digest: str, fmt: str) -> List[Tuple[str, int]]:
+    """ Write the resized variants of `source`, returning (file name, width) for each.
+
+    The last one is the source recompressed at its own width, unless that comes out no smaller
+    than the source, in which case the source itself stays the largest candidate.
+    """
+    source = pathlib.Path(source)
+    dest = source.parent / VARIANT_DIR
+
+    made = []
+    with Image.open(source) as img:
+        for width in LADDER:
+            if width >= img.width:
+                break
+
+            height = max(1, round(img.height * width / img.width))
+            name = f'{source.stem}-{width}.{digest[:8]}.{fmt}'
+            _save(img.resize((width, height), Image.LANCZOS), dest / name, fmt)
+            made.append((name, width))
+
+        name = f'{source.stem}-{img.width}.{digest[:8]}.{fmt}'
+        _save(img, dest / name, fmt)
+        if (dest / name).stat().st_size < source.stat().st_size:
+            made.append((name, img.width))
+        else:
+            (dest / name).unlink()
+
+    return made
+
+
+def build_variants(img_dir: pathlib.Path, jobs: int = 0) -> Tuple[int, int]:
+    """ Bring img_dir/sized/ up to date with img_dir/*.png. Returns (rebuilt, reused) counts. """
+    dest = img_dir / VARIANT_DIR
+    dest.mkdir(exist_ok=True)
+    manifest_path = dest / MANIFEST_NAME
+
+    try:
+        old = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        old = {}
+
+    fmt = variant_format() if Image is not None else None
+    manifest: Dict[str, dict] = {}
+    todo: Dict[str, str] = {}
+
+    for source in sorted(img_dir.glob('*.png')):
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        entry = old.get(source.name)
+        if (
+            entry is not None and entry['sha256'] == digest and entry['format'] == fmt
+            and entry.get('version') == VARIANTS_VERSION
+            and all((dest / name).exists() for name, _ in entry['variants'])
+        ):
+            manifest[source.name] = entry
+            continue
+
+        width, height = png_size(source) or (None, None)
+        manifest[source.name] = {
+            'sha256': digest, 'width': width, 'height': height, 'format': fmt, 'variants': [],
+            'version': VARIANTS_VERSION,
+        }
+        if fmt is not None:
+            todo[source.name] = digest
+
+    if todo:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs or None) as pool:
+            futures = {
+                name: pool.submit(_make_variants, str(img_dir / name), digest, fmt)
+                for name, digest in todo.items()
+            }
+            for name, future in futures.items():
+                manifest[name]['variants'] = future.result()
+
+    # remove variants of deleted or changed sources
+    keep = {name for entry in manifest.values() for name, _ in entry['variants']} | {MANIFEST_NAME}
+    for stale in dest.iterdir():
+        if stale.name not in keep:
+            stale.unlink()
+
+    output.write(manifest_path, json.dumps(manifest, indent=4, sort_keys=True))
+    return len(todo), len(manifest) - len(todo)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_manifest(path: pathlib.Path, mtime: float) -> dict:
+    return json.loads(path.read_text())
+
+
+def manifest_entry(image: pathlib.Path) -> Optional[dict]:
+    manifest_path = image.parent / VARIANT_DIR / MANIFEST_NAME
+    try:
+        manifest = _load_manifest(manifest_path, manifest_path.stat().st_mtime)
+    except (OSError, ValueError):
+        return None
+    return manifest.get(image.name)
+
+
+def img_tag(src: str, folder: pathlib.Path, sizes: str, width: Optional[int] = None, **attrs) -> str:
+    """ An <img> for `src` (relative to `folder`, the page's directory).
+
+    With `width`, the image is displayed at that many pixels; otherwise its intrinsic dimensions
+    are given and `attrs` (e.g. style) are expected to scale it. Remote and unknown images are
+    passed through with only `width` and `attrs`. WebP variants are offered through a <picture>.
+    """
+    entry = None
+    if src and '://' not in src and (folder / src).is_file():
+        entry = manifest_entry(folder / src)
+        if entry is None and (size := png_size(folder / src)):
+            entry = {'width': size[0], 'height': size[1], 'variants': []}
+
+    parts = [f'src="{html.escape(src)}"']
+    source = None
+    if entry and entry['variants']:
+        base = posixpath.join(posixpath.dirname(src), VARIANT_DIR)
+        srcset = [f'{posixpath.join(base, name)} {w}w' for name, w in entry['variants']]
+        # the source is only a candidate when it wasn't recompressed at full width
+        if entry['variants'][-1][1] != entry['width']:
+            srcset.append(f'{src} {entry["width"]}w')
+        if entry.get('format') == 'webp':
+            # srcset has no format negotiation, so WebP candidates go in a <source> that only
+            # browsers supporting WebP will use; everyone else gets the plain <img>
+            source = f'<source type="image/webp" srcset="{", ".join(srcset)}" sizes="{sizes}">'
+        else:
+            parts.append(f'srcset="{", ".join(srcset)}"')
+            parts.append(f'sizes="{sizes}"')
+
+    if entry and entry['width'] and width is not None:
+        parts.append(f'width="{width}" height="{round(entry["height"] * width / entry["width"])}"')
+    elif entry and entry['width']:
+        parts.append(f'width="{entry["width"]}" height="{entry["height"]}"')
+    elif width is not None:
+        parts.append(f'width="{width}"')
+
+    parts.extend(f'{k.rstrip("_")}="{v}"' for k, v in attrs.items())
+    img = f'<img {" ".join(parts)}>'
+    return f'<picture>{source}{img}</picture>' if source else img
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'dirs',
+        nargs='*', type=pathlib.Path,
+        help='image directories to process, relative to the repository root (default: every */imgs)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int, default=0,
+        help='number of worker processes used to resize images (default: one per CPU)'
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_command_line(argv)
+    if Image is None:
+        sys.stderr.write('Pillow is not installed; recording image dimensions only.\n')
+
+    for img_dir in args.dirs or sorted(p.relative_to(ROOT) for p in ROOT.glob('*/imgs')):
+        rebuilt, reused = build_variants(ROOT / img_dir, jobs=args.jobs)
+        print(f'{img_dir}: {rebuilt} rebuilt, {reused} unchanged')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+""" The one place the generators write their pages.
+
+write() renders to a temporary file beside the destination and renames it into place, so a
+crashed build never leaves a half-written page. It only does that when the content actually
+changed, so unchanged pages keep their mtimes (and CDN/browser caches stay valid).
+"""
+import hashlib
+import os
+import pathlib
+import tempfile
+from typing import List, Union
+
+from . import tracing
+
+
+written: List[pathlib.Path] = []
+unchanged: List[pathlib.Path] = []
+
+
+def _digest_file(path: pathlib.Path) -> bytes:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.digest()
+
+
+def write(path: pathlib.Path, content: Union[str, bytes]) -> bool:
+    """ Atomically replace `path` with `content` (str is encoded as UTF-8), unless it already
+    holds exactly that. Returns whether the file was written.
+    """
+    path = pathlib.Path(path)
+    data = content.encode('utf-8') if isinstance(content, str) else content
+
+    with tracing.span(str(path), cat='write', bytes=len(data)) as args:
+        try:
+            same = path.stat().st_size == len(data) and _digest_file(path) == hashlib.sha256(data).digest()
+        except FileNotFoundError:
+            same = False
+
+        # the comparison is still part of the span, but only replaced files count as written
+        args['written'] = not same
+        if same:
+            unchanged.append(path)
+            return False
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if path.exists():
+                os.chmod(tmp, path.stat().st_mode & 0o777)
+            else:
+                os.chmod(tmp, 0o666 & ~_umask())
+            os.replace(tmp, path)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
+
+    written.append(path)
+    return True
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def summary() -> str:
+    return f'{len(written)} written, {len(unchanged)} unchanged'
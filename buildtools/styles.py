@@ -0,0 +1,188 @@
+""" Inline the stylesheets a generated page needs into its <head>.
+
+inline_css() reads each local stylesheet the page links, keeps only the rules whose selectors can
+match something in the page, and writes them into a single <style> block, so the first paint
+doesn't wait on any further request. Stylesheets passed as `defer` are loaded without blocking
+rendering instead. Once fonts/fonts.css has been vendored (see fonts.py), the Google Fonts links
+are dropped in favour of @font-face rules for the self-hosted copies; until then they're deferred
+like any other, with display=swap and preconnect hints, so first paint never waits on Google.
+
+The page is first put back the way the generator wrote it, so running inline_css() over an
+already inlined page (like mka/deconstruction.html, which is edited in place) picks up any
+changes to the stylesheets instead of inlining twice.
+"""
+import os
+import pathlib
+import posixpath
+import re
+import sys
+from typing import List, Sequence, Set, Tuple
+
+if __package__:
+    from . import fonts
+else:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+    from buildtools import fonts
+
+
+LINK = re.compile(r'([ \t]*)<link\b([^>]*)>(\n?)')
+ATTR = re.compile(r'([\w-]+)\s*=\s*"([^"]*)"')
+INLINED = re.compile(r'<style data-inlined="([^"]*)">.*?</style>', re.S)
+DEFERRED = re.compile(
+    r'<link rel="preload" href="([^"]*)" as="style" onload="[^"]*">'
+    r'<noscript><link href="\1" rel="stylesheet"></noscript>'
+)
+GOOGLE_FONTS = 'https://fonts.googleapis.com/'
+# opened ahead of the Google Fonts stylesheets while those are still linked
+PRECONNECT = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com" />',
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />',
+)
+PRECONNECTED = re.compile('|'.join(rf'[ \t]*{re.escape(link)}\n?' for link in PRECONNECT))
+
+
+def _deferred(href: str) -> str:
+    return (
+        f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        f'<noscript><link href="{href}" rel="stylesheet"></noscript>'
+    )
+
+
+def _restore(page: str) -> str:
+    """ Turn inlined and deferred stylesheets back into plain links, and drop the preconnect hints. """
+    page = PRECONNECTED.sub('', page)
+    page = INLINED.sub(
+        lambda m: '\n'.join(f'<link href="{href}" rel="stylesheet" />' for href in m.group(1).split()), page
+    )
+    return DEFERRED.sub(lambda m: f'<link href="{m.group(1)}" rel="stylesheet" />', page)
+
+
+def _blocks(css: str) -> List[Tuple[str, str]]:
+    """ Split a stylesheet into (prelude, body) pairs; the body of an @media rule is itself a stylesheet. """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    blocks = []
+    i = 0
+    while (start := css.find('{', i)) >= 0:
+        depth, end = 1, start + 1
+        while depth and end < len(css):
+            depth += {'{': 1, '}': -1}.get(css[end], 0)
+            end += 1
+        blocks.append((' '.join(css[i:start].split()), css[start + 1:end - 1]))
+        i = end
+    return blocks
+
+
+def page_names(page: str) -> Tuple[Set[str], Set[str], Set[str]]:
+    """ The tag names, classes and ids used anywhere in the page, including markup built by its scripts. """
+    tags = {t.lower() for t in re.findall(r'<([a-zA-Z][\w-]*)', page)}
+    classes = {c for value in re.findall(r'class\s*=\s*["\']([^"\']*)', page) for c in value.split()}
+    classes.update(re.findall(r'classList\.(?:add|toggle)\(["\']([\w-]+)', page))
+    ids = set(re.findall(r'id\s*=\s*["\']([^"\']*)', page))
+    return tags, classes, ids
+
+
+def _matches(selector: str, tags: Set[str], classes: Set[str], ids: Set[str]) -> bool:
+    # pseudo-classes and attribute selectors depend on state, so only the names are checked
+    selector = re.sub(r'::?[\w-]+(\([^)]*\))?|\[[^\]]*\]', '', selector)
+    names = {'': tags, '.': classes, '#': ids}
+    return all(
+        (name if prefix else name.lower()) in names[prefix]
+        for prefix, name in re.findall(r'([.#]?)(-?[A-Za-z_][\w-]*)', selector)
+    )
+
+
+def prune(css: str, names: Tuple[Set[str], Set[str], Set[str]]) -> List[str]:
+    """ The rules of `css` that can apply to a page using `names`, one minified rule per string. """
+    rules = []
+    for prelude, body in _blocks(css):
+        if prelude.startswith('@media'):
+            inner = prune(body, names)
+            if inner:
+                rules.append(f'{prelude}{{{"".join(inner)}}}')
+        elif prelude.startswith('@'):
+            rules.append(f'{prelude}{{{" ".join(body.split())}}}')
+        else:
+            kept = [s.strip() for s in prelude.split(',') if _matches(s, *names)]
+            if kept:
+                rules.append(f'{",".join(kept)}{{{" ".join(body.split())}}}')
+    return rules
+
+
+def _rebase_urls(css: str, sheet_dir: pathlib.Path, page_dir: pathlib.Path) -> str:
+    """ Rewrite the relative url()s of a stylesheet in sheet_dir for a page in page_dir. """
+    def rebase(m):
+        url = m.group(1).strip('\'"')
+        if re.match(r'[a-z]+:|/|#', url):
+            return m.group(0)
+        return f'url({posixpath.normpath(os.path.relpath(sheet_dir / url, page_dir)).replace(os.sep, "/")})'
+    return re.sub(r'url\(([^)]*)\)', rebase, css)
+
+
+def font_faces(used: str, page_dir: pathlib.Path) -> List[str]:
+    """ The vendored @font-face rules for the families that `used` (the page and its CSS) mentions. """
+    if not fonts.FONTS_CSS.exists():
+        return []
+
+    families = {face.family for face in fonts.vendored_faces() if face.family in used}
+    rules = []
+    for prelude, body in _blocks(_rebase_urls(fonts.FONTS_CSS.read_text(), fonts.FONTS_DIR, page_dir)):
+        family = re.search(r'font-family:\s*["\']?([^;"\']+)', body)
+        if family and family.group(1).strip() in families:
+            rules.append(f'{prelude}{{{" ".join(body.split())}}}')
+    return rules
+
+
+def inline_css(page: str, page_dir: pathlib.Path, defer: Sequence[str] = ()) -> str:
+    """ `page` with its local stylesheets inlined (or deferred) and its fonts self-hosted.
+
+    page_dir is the directory the page's relative links resolve against.
+    """
+    page = _restore(page)
+    head_end = page.find('</head>')
+    if head_end < 0:
+        return page
+    head, rest = page[:head_end], page[head_end:]
+
+    vendored = fonts.FONTS_CSS.exists()
+    inlined: List[Tuple[str, str]] = []  # (href, contents)
+    preconnected: List[str] = []
+
+    def replace(m):
+        indent, attrs, newline = m.groups()
+        attrs = dict(ATTR.findall(attrs))
+        href = attrs.get('href', '')
+        if attrs.get('rel') != 'stylesheet':
+            return m.group(0)
+        if href.startswith(GOOGLE_FONTS):
+            if vendored:
+                return ''
+            # loaded without blocking the first paint, and with display=swap the text shows in the
+            # fallback font until Google's arrives instead of staying invisible
+            if 'display=' not in href:
+                href = f'{href}&display=swap'
+            link = f'{indent}{_deferred(href)}{newline}'
+            if preconnected:
+                return link
+            preconnected.append(href)
+            return ''.join(f'{indent}{hint}\n' for hint in PRECONNECT) + link
+        if href in defer:
+            return f'{indent}{_deferred(href)}{newline}'
+        if '://' in href or not (page_dir / href).is_file():
+            return m.group(0)
+
+        sheet = (page_dir / href).resolve()
+        inlined.append((href, _rebase_urls(sheet.read_text(encoding='utf-8'), sheet.parent, page_dir.resolve())))
+        # the <style> block goes where the first of them was
+        return '\x00' if len(inlined) == 1 else ''
+
+    head = LINK.sub(replace, head)
+    if not inlined:
+        return head + rest
+
+    names = page_names(page)
+    rules = [rule for _, css in inlined for rule in prune(css, names)]
+    rules = font_faces(head + rest + ''.join(rules), page_dir.resolve()) + rules
+
+    hrefs = ' '.join(href for href, _ in inlined)
+    style = f'    <style data-inlined="{hrefs}">\n' + ''.join(f'{rule}\n' for rule in rules) + '</style>\n'
+    return head.replace('\x00', style, 1) + rest
@@ -0,0 +1,147 @@
+""" Opt-in build instrumentation.
+
+Nothing is recorded until enable() (or session() with a path) is called, so the hooks can stay in the
+generators permanently. The recorded events are exported in the Chrome trace-event format, which
+chrome://tracing and https://ui.perfetto.dev both open directly.
+"""
+import collections
+import contextlib
+import functools
+import json
+import os
+import pathlib
+import sqlite3
+import sys
+import threading
+import time
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+class Tracer:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events: List[dict] = []
+        # name -> [calls, total seconds] for functions wrapped with @timed
+        self.timings = collections.defaultdict(lambda: [0, 0.0])
+        self._lock = threading.Lock()
+
+    def _us(self, t: float) -> float:
+        return (t - self.origin) * 1e6
+
+    def complete(self, name: str, cat: str, start: float, end: float, **args):
+        """ Record a span that ran from `start` to `end` (both time.perf_counter() values). """
+        event = {
+            'name': name, 'cat': cat, 'ph': 'X',
+            'ts': self._us(start), 'dur': (end - start) * 1e6,
+            'pid': os.getpid(), 'tid': threading.get_ident(),
+            'args': args,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def export(self, path: pathlib.Path):
+        events = list(self.events)
+        for name, (calls, total) in self.timings.items():
+            # aggregated hot functions have no single span, so they're reported as metadata
+            events.append({
+                'name': name, 'cat': 'function', 'ph': 'i', 's': 'g', 'ts': 0,
+                'pid': os.getpid(), 'args': {'calls': calls, 'total_ms': total * 1e3},
+            })
+        pathlib.Path(path).write_text(json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}))
+
+    def summary(self, top: int = 10) -> str:
+        spans = collections.defaultdict(lambda: [0, 0.0])
+        for e in self.events:
+            if e['ph'] == 'X':
+                key = (e['cat'], e['name'])
+                spans[key][0] += 1
+                spans[key][1] += e['dur'] / 1e3
+        for name, (calls, total) in self.timings.items():
+            spans[('function', name)] = [calls, total * 1e3]
+
+        lines = [f'{"total ms":>10} {"calls":>7}  {"category":<8}  name']
+        ranked = sorted(spans.items(), key=lambda kv: kv[1][1], reverse=True)
+        for (cat, name), (calls, total) in ranked[:top]:
+            name = ' '.join(name.split())
+            lines.append(f'{total:10.2f} {calls:7}  {cat:<8}  {name[:90]}')
+
+        written = [e['args'] for e in self.events if e['cat'] == 'write' and e['args'].get('written', True)]
+        if written:
+            nbytes = sum(a['bytes'] for a in written)
+            lines.append(f'{len(written)} files written, {nbytes:,} bytes')
+
+        return '\n'.join(lines)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def enable() -> Tracer:
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+@contextlib.contextmanager
+def session(path: Optional[pathlib.Path], top: int = 10) -> Iterator[Optional[Tracer]]:
+    """ Trace the body when `path` is given, then write the trace there and print a summary. """
+    global _tracer
+    if path is None:
+        yield None
+        return
+
+    tracer = enable()
+    try:
+        with span('total', cat='build'):
+            yield tracer
+    finally:
+        _tracer = None
+        tracer.export(path)
+        sys.stderr.write(f'{tracer.summary(top)}\ntrace written to {path}\n')
+
+
+@contextlib.contextmanager
+def span(name: str, cat: str = 'stage', **args):
+    """ Record the body as a span. It yields the span's args, so results known only at the end can be added. """
+    if _tracer is None:
+        yield args
+        return
+
+    start = time.perf_counter()
+    try:
+        yield args
+    finally:
+        _tracer.complete(name, cat, start, time.perf_counter(), **args)
+
+
+def timed(name: str):
+    """ Aggregate the call count and total time of a hot function instead of recording every call. """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with _tracer._lock:
+                    entry = _tracer.timings[name]
+                    entry[0] += 1
+                    entry[1] += elapsed
+        return wrapper
+    return decorator
+
+
+def query(conn: sqlite3.Connection, sql: str, args: Sequence = ()) -> Tuple[Tuple[str, ...], list]:
+    """ Run `sql` and fetch every row, recording the statement, its duration and the row count. """
+    start = time.perf_counter()
+    cursor = conn.execute(sql, args)
+    columns = tuple(desc[0] for desc in cursor.description or ())
+    rows = cursor.fetchall()
+
+    if _tracer is not None:
+        _tracer.complete(' '.join(sql.split()), 'sql', start, time.perf_counter(), args=list(args), rows=len(rows))
+    return columns, rows
@@ -0,0 +1,379 @@
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import os
+import pathlib
+import re
+import sys
+from typing import List, Optional
+
+import poem_helpers
+
+
+HERE = pathlib.Path(__file__).parent
+sys.path.append(str(HERE.resolve().parent))
+from buildtools import output, styles, tracing  # noqa: E402
+from buildtools.cache import BuildCache  # noqa: E402
+
+CACHE_FILE = HERE / '.cache' / 'poems.json'
+
+# a rendered poem: everything the page needs from it, without re-parsing the source
+Fragment = collections.namedtuple('Fragment', ('id', 'title', 'html'))
+
+
+def bisect_iter(iterable, key=bool):
+    a, b = itertools.tee(iter(iterable), 2)
+    return itertools.takewhile(key, a), itertools.dropwhile(key, b)
+
+
+@contextlib.contextmanager
+def tag(stream, tagname, **kwargs):
+    stream.write(f'<{tagname}')
+    stream.write(''.join(f' {k}="{v}"' for k, v in kwargs.items()))
+    stream.write('>')
+
+    try:
+        yield
+    finally:
+        stream.write(f'</{tagname}>')
+
+
+class Poem:
+    def __init__(self, title: str, id: str, stanzas: List[List[str]]):
+        self.title = title
+        self.id = id
+        self.stanzas = stanzas
+
+    @classmethod
+    def from_file(cls, path: pathlib.Path):
+        lines = iter(path.read_text().splitlines())
+
+        # strip out title data
+        _title, lines = bisect_iter(lines, lambda line: line.startswith('TITLE'))
+        title = '<br/>\n\t'.join(
+            parse(re.match(r'TITLE: (.*)', line).group(1))
+            for line in _title
+        )
+
+        # strip out ID data
+        _id, lines = bisect_iter(lines, lambda line: line.startswith('ID'))
+        poemid = [
+            parse(re.match(r'ID: (.*)', line).group(1))
+            for line in _id
+        ]
+        if len(poemid) == 0:
+            raise ValueError(f'No poem ID found in {path}')
+        elif len(poemid) > 1:
+            raise ValueError(f'Multiple poem IDs found in {path}')
+
+        # parse stanzas
+        stanzas = [[]]
+        while not (line := next(lines)).rstrip():
+            # ignore blank lines at the start
+            pass
+
+        lines = [line] + list(lines)
+
+        while lines:
+            line = lines.pop(0)
+
+            if (line := line.rstrip()):
+                stanzas[-1].append(parse(line))
+            else:
+                stanzas.append([])
+
+        return cls(title=title, id=poemid[0], stanzas=stanzas)
+
+    def htmlify(self):
+        s = io.StringIO()
+
+        s.write(f'<h1 class="title poemtitle" id="{self.id}">\n\t{self.title}\n</h1>\n')
+        with tag(s, tagname='div', **{'class': 'poem'}):
+            for stanza in self.stanzas:
+                with tag(s, tagname='p'):
+                    s.write('<br/>\n'.join(stanza))
+
+        s.seek(0)
+        return s.read()
+
+
+@tracing.timed('parse')
+def parse(text):
+    # handle <ja>...</ja> tags
+    text = re.sub(r'<ja>(.*?)</ja>', r'<span class="japanese">\g<1></span>', text)
+
+    # convert **...*** to <b>...</b>
+    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\g<1></b>', text)
+
+    # convert *...* to <i>...</i>
+    text = re.sub(r'\*(.*?)\*', r'<i>\g<1></i>', text)
+
+    # convert _..._ to underline
+    text = re.sub(r'_(.*?)_', r'<span class="underline">\g<1></span>', text)
+
+    # handle leading spaces
+    text = re.sub(r'^\s+', '&nbsp;&nbsp;', text)
+
+    return text
+
+
+def builder_version() -> str:
+    """ Hash of the parser and helper sources. Editing either one invalidates every cached fragment. """
+    h = hashlib.sha256()
+    for source in (pathlib.Path(__file__), pathlib.Path(poem_helpers.__file__)):
+        h.update(source.read_bytes())
+    return h.hexdigest()
+
+
+class FragmentCache(BuildCache):
+    """ Rendered poems from previous builds, keyed on the SHA-256 of each poem file's contents. """
+
+    def get(self, digest: str) -> Optional[Fragment]:
+        fragment = super().get(digest)
+        return None if fragment is None else Fragment(*fragment)
+
+
+def render(path: pathlib.Path) -> Fragment:
+    """ Parse, htmlify and post-process a single poem file. """
+    poem = Poem.from_file(path)
+
+    html = poem.htmlify()
+    if (r := poem_helpers.HELPERS.get(poem.title)):
+        html = r(html)
+
+    return Fragment(id=poem.id, title=poem.title, html=html)
+
+
+def render_all(cache: Optional[FragmentCache] = None, jobs: int = 1) -> List[Fragment]:
+    """ Render every poem in poems/, in page order, reusing cached fragments for unchanged files.
+    With jobs > 1, the poems that do need rendering are spread over a process pool.
+    """
+    paths = sorted((HERE / 'poems').iterdir(), key=lambda p: p.stem.lower())
+    fragments: List[Optional[Fragment]] = [None] * len(paths)
+    digests: List[Optional[str]] = [None] * len(paths)
+
+    if cache is not None:
+        with tracing.span('hash poems', files=len(paths)):
+            for i, path in enumerate(paths):
+                digests[i] = hashlib.sha256(path.read_bytes()).hexdigest()
+                fragments[i] = cache.get(digests[i])
+
+    todo = [i for i, fragment in enumerate(fragments) if fragment is None]
+    if jobs > 1 and len(todo) > 1:
+        # spans inside the workers aren't collected; the pool as a whole is one span
+        with tracing.span('render poems (pool)', poems=len(todo), jobs=jobs):
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+                # map() yields in submission order, so the page order is unaffected
+                chunksize = max(1, len(todo) // (4 * jobs))
+                rendered = list(pool.map(render, (paths[i] for i in todo), chunksize=chunksize))
+    else:
+        rendered = []
+        for i in todo:
+            with tracing.span(f'render {paths[i].name}'):
+                rendered.append(render(paths[i]))
+
+    for i, fragment in zip(todo, rendered):
+        fragments[i] = fragment
+        if cache is not None:
+            cache.put(digests[i], fragment)
+
+    return fragments
+
+
+def write_head(f, title: str = 'Humanity of a Former Automaton', extra: str = ''):
+    with tag(f, tagname='head'):
+        with tag(f, tagname='title'):
+            f.write(f'{title}\n')
+        f.write(extra)
+        f.write('''<link href="https://fonts.googleapis.com/css?family=Tangerine" rel="stylesheet" />\n''')
+        f.write('''<link href="https://fonts.googleapis.com/css?family=Montserrat" rel="stylesheet" />\n''')
+        f.write('''<link href="../styles/base-style.css" rel="stylesheet" />\n''')
+        f.write('''<link href="style.css" rel="stylesheet" />\n''')
+        f.write('''<link rel="icon" href="../favicon.png" type="image/x-icon">''')
+        f.write('''<meta name="viewport" content="width=device-width, initial-scale=1">''')
+
+
+def write_banner(f):
+    with tag(f, tagname='h1', **{'class': 'title'}):
+        f.write('Humanity of a Former Automaton\n')
+    with tag(f, tagname='h2', **{'class': 'title'}):
+        f.write('Lily Ellington\n')
+
+
+def write_page(f, fragments: List[Fragment]):
+    with tag(f, tagname='html'):
+        write_head(f)
+
+        with tag(f, tagname='body', style='font-family: Montserrat, sans-serif;'):
+            # write page title
+            with tag(f, tagname='div', **{'class': 'main'}):
+                write_banner(f)
+
+                # write each poem
+                for fragment in fragments:
+                    f.write(fragment.html)
+
+            # build navbar
+            with tag(f, tagname='div', **{'class': 'sidenav'}):
+                for fragment in fragments:
+                    f.write(f"""<a href="#{fragment.id}">{fragment.title}</a><hr class="navdivider">""")
+
+
+def render_page(fragments: List[Fragment]) -> str:
+    """ home.html, with every poem on the one page. """
+    stream = io.StringIO()
+    write_page(stream, fragments)
+    return styles.inline_css(stream.getvalue(), HERE)
+
+
+# The paginated pages live in PAGES_DIR but set <base href="../">, so every relative link in the
+# fragments (style.css, ../mka/imgs/...) resolves exactly as it does from home.html.
+PAGES_DIR = HERE / 'pages'
+
+# Fills the sidenav from the shared manifest, so a page's size doesn't depend on the number of poems.
+NAVBAR_SCRIPT = """
+fetch('pages/manifest.json').then(r => r.json()).then(manifest => {
+    let nav = document.getElementById('sidenav');
+    for (let entry of manifest.poems) {
+        nav.insertAdjacentHTML('beforeend', `<a href="${entry.href}">${entry.title}</a><hr class="navdivider">`);
+    }
+});
+"""
+
+
+def chunked(items: list, size: int) -> List[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def write_paginated(fragments: List[Fragment], per_page: int = 1):
+    """ Write the poems as PAGES_DIR/<first poem id>.html, per_page poems to a file, along with
+    an index page and manifest.json listing every poem and the page it lives on.
+    """
+    if per_page < 1:
+        raise ValueError(f'per_page must be at least 1, not {per_page}')
+    PAGES_DIR.mkdir(exist_ok=True)
+
+    chunks = chunked(fragments, per_page)
+    pagenames = [f'{chunk[0].id}.html' for chunk in chunks]
+
+    # drop pages left over from a previous build with a different page size or set of poems
+    for stale in PAGES_DIR.glob('*.html'):
+        if stale.name not in pagenames and stale.name != 'index.html':
+            stale.unlink()
+
+    manifest = {
+        'pages': [f'pages/{name}' for name in pagenames],
+        'poems': [
+            {'id': fragment.id, 'title': fragment.title, 'href': f'pages/{name}#{fragment.id}'}
+            for chunk, name in zip(chunks, pagenames)
+            for fragment in chunk
+        ],
+    }
+    output.write(PAGES_DIR / 'manifest.json', json.dumps(manifest, indent=4))
+
+    for i, (chunk, name) in enumerate(zip(chunks, pagenames)):
+        prev = pagenames[i - 1] if i > 0 else None
+        next_ = pagenames[i + 1] if i + 1 < len(pagenames) else None
+
+        hints = '<base href="../">\n'
+        hints += ''.join(f'<link rel="prefetch" href="pages/{n}" />\n' for n in (prev, next_) if n)
+        title = re.sub(r'<.*?>', '', chunk[0].title) if per_page == 1 else f'Humanity of a Former Automaton ({i + 1})'
+
+        f = io.StringIO()
+        with tag(f, tagname='html'):
+            write_head(f, title=title, extra=hints)
+
+            with tag(f, tagname='body', style='font-family: Montserrat, sans-serif;'):
+                with tag(f, tagname='div', **{'class': 'main'}):
+                    for fragment in chunk:
+                        f.write(fragment.html)
+
+                    with tag(f, tagname='p', **{'class': 'pagenav'}):
+                        if prev:
+                            f.write(f'<a href="pages/{prev}">&larr; previous</a> ')
+                        f.write('<a href="pages/index.html">index</a>')
+                        if next_:
+                            f.write(f' <a href="pages/{next_}">next &rarr;</a>')
+
+                with tag(f, tagname='div', id='sidenav', **{'class': 'sidenav'}):
+                    pass
+                # after #sidenav in the body, so it runs once the element exists
+                with tag(f, tagname='script'):
+                    f.write(NAVBAR_SCRIPT)
+
+        output.write(PAGES_DIR / name, styles.inline_css(f.getvalue(), HERE))
+
+    f = io.StringIO()
+    with tag(f, tagname='html'):
+        first = f'<link rel="prefetch" href="pages/{pagenames[0]}" />\n' if pagenames else ''
+        write_head(f, extra='<base href="../">\n' + first)
+
+        with tag(f, tagname='body', style='font-family: Montserrat, sans-serif;'):
+            with tag(f, tagname='div', **{'class': 'main'}):
+                write_banner(f)
+                with tag(f, tagname='div', **{'class': 'poem'}):
+                    for entry in manifest['poems']:
+                        f.write(f"""<p><a href="{entry['href']}">{entry['title']}</a></p>""")
+
+    output.write(PAGES_DIR / 'index.html', styles.inline_css(f.getvalue(), HERE))
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--no-cache',
+        dest='use_cache', action='store_false',
+        help=f're-render every poem, ignoring (and not updating) {CACHE_FILE.relative_to(HERE)}'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int, default=1,
+        help='number of worker processes used to render poems (0 for one per CPU)'
+    )
+    parser.add_argument(
+        '-p', '--paginate',
+        type=int, nargs='?', const=1, default=None, metavar='N',
+        help=f'write {PAGES_DIR.relative_to(HERE)}/*.html with N poems per page (default 1) instead of home.html; '
+             'the site\'s index.html still links hfa/home.html, so switch it to hfa/pages/index.html by hand '
+             'to publish them'
+    )
+    parser.add_argument(
+        '--trace',
+        type=pathlib.Path, metavar='OUT.json',
+        help='record a Chrome/Perfetto trace of the build to this file and print a summary'
+    )
+
+    args = parser.parse_args(argv)
+    if args.paginate is not None and args.paginate < 1:
+        parser.error(f'--paginate needs at least 1 poem per page, not {args.paginate}')
+
+    return args
+
+
+def main(argv=None):
+    args = parse_command_line(argv)
+
+    with tracing.session(args.trace):
+        cache = FragmentCache(CACHE_FILE, builder_version()) if args.use_cache else None
+        jobs = args.jobs or os.cpu_count() or 1
+        fragments = render_all(cache, jobs=jobs)
+
+        if args.paginate is not None:
+            with tracing.span('write pages'):
+                write_paginated(fragments, per_page=args.paginate)
+        else:
+            output.write(HERE / 'home.html', render_page(fragments))
+
+        if cache is not None:
+            cache.save()
+            print(f'{len(fragments)} poems ({cache.hits} cached, {cache.misses} rendered)')
+        print(output.summary())
+
+
+if __name__ == '__main__':
+    main()
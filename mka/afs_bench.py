@@ -0,0 +1,339 @@
+""" Synthetic AFS archives for benchmarking and fuzzing afs_extract.py.
+
+    python afs_bench.py generate OUT.AFS --entries 500 --size 4096-65536 --duplicates 0.3
+    python afs_bench.py bench [--scale 2] [--convert .wav]
+    python afs_bench.py fuzz [--rounds 200]
+
+Every generated entry is a small but well-formed ADX stream (header, "(c)CRI", random frames),
+so the archives also exercise --scan and, when ffmpeg is installed, --convert.
+"""
+import argparse
+import contextlib
+import io
+import json
+import pathlib
+import random
+import resource
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+import afs_extract
+
+
+HERE = pathlib.Path(__file__).resolve().parent
+
+CORRUPTIONS = (
+    'bad-magic',        # first four bytes aren't AFS\0
+    'huge-count',       # entry count of 0xFFFFFFFF
+    'truncated-toc',    # file ends partway through the TOC
+    'offset-past-eof',  # an entry starts beyond the end of the file
+    'huge-size',        # an entry claims to be ~4 GiB long
+    'truncated-data',   # file ends partway through the last entry
+    'overlap-toc',      # an entry points back into the TOC
+)
+
+# (entries, min size, max size, duplicate fraction) for `bench`, before --scale
+SHAPES = (
+    (2000, 1 << 10, 8 << 10, 0.0),
+    (2000, 1 << 10, 8 << 10, 0.5),
+    (200, 64 << 10, 512 << 10, 0.0),
+    (200, 64 << 10, 512 << 10, 0.5),
+    (16, 4 << 20, 8 << 20, 0.25),
+)
+
+
+def adx_payload(size: int, rng: random.Random, channels: int = 1, sample_rate: int = 22050) -> bytes:
+    """ A version 3 ADX stream of roughly `size` bytes, filled with random 18-byte frames. """
+    data_start = 0x34
+    frame = 18 * channels
+    frames = max(1, (size - data_start) // frame)
+
+    head = bytearray(data_start)
+    head[0x00:0x02] = b'\x80\x00'
+    head[0x02:0x04] = (data_start - 4).to_bytes(2, 'big')
+    head[0x04:0x08] = bytes((3, 18, 4, channels))
+    head[0x08:0x0C] = sample_rate.to_bytes(4, 'big')
+    head[0x0C:0x10] = (frames * 32).to_bytes(4, 'big')
+    head[0x10:0x12] = (500).to_bytes(2, 'big')
+    head[0x12] = 3
+    head[data_start - 6:data_start] = b'(c)CRI'
+
+    return bytes(head) + rng.randbytes(frames * frame)
+
+
+def build_archive(
+    path: pathlib.Path,
+    entries: int,
+    size: Tuple[int, int],
+    align: int = 2048,
+    duplicates: float = 0.0,
+    corrupt: Optional[str] = None,
+    seed: int = 0,
+) -> int:
+    """ Write a synthetic archive to `path`, returning its size in bytes.
+
+    `duplicates` is the fraction of entries that repeat an earlier entry byte for byte.
+    `corrupt` is one of CORRUPTIONS, applied after the archive is laid out.
+    """
+    rng = random.Random(seed)
+
+    payloads: List[bytes] = []
+    for _ in range(entries):
+        if payloads and rng.random() < duplicates:
+            payloads.append(rng.choice(payloads))
+        else:
+            payloads.append(adx_payload(rng.randint(*size), rng))
+
+    def aligned(n: int) -> int:
+        return -(-n // align) * align
+
+    toc = []
+    offset = aligned(8 + 8 * entries)
+    for payload in payloads:
+        toc.append([offset, len(payload)])
+        offset = aligned(offset + len(payload))
+
+    num = entries
+    if corrupt == 'huge-count':
+        num = 0xFFFFFFFF
+    elif corrupt == 'offset-past-eof' and toc:
+        toc[-1][0] = offset + (1 << 30)
+    elif corrupt == 'huge-size' and toc:
+        toc[0][1] = 0xFFFFFFF0
+    elif corrupt == 'overlap-toc' and toc:
+        toc[-1][0] = 4
+
+    buf = io.BytesIO()
+    buf.write(b'AFX\x00' if corrupt == 'bad-magic' else b'AFS\x00')
+    buf.write(struct.pack('<I', num))
+    for entry in toc:
+        buf.write(struct.pack('<II', *entry))
+    for (entry_offset, _), payload in zip(toc, payloads):
+        if entry_offset < buf.tell() or entry_offset > offset:
+            # corrupted entries don't get their payload written where they claim it is
+            continue
+        buf.write(b'\0' * (entry_offset - buf.tell()))
+        buf.write(payload)
+    buf.write(b'\0' * (aligned(buf.tell()) - buf.tell()))
+
+    data = buf.getvalue()
+    if corrupt == 'truncated-toc':
+        data = data[:8 + 4 * max(entries, 1)]
+    elif corrupt == 'truncated-data' and toc:
+        data = data[:toc[-1][0] + toc[-1][1] // 2]
+
+    path.write_bytes(data)
+    return len(data)
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    """ "4096" or "4096-65536", with optional k/M suffixes. """
+    def one(part):
+        scale = {'k': 1 << 10, 'm': 1 << 20}.get(part[-1].lower(), 1)
+        return int(part.rstrip('kKmM')) * scale
+
+    low, _, high = text.partition('-')
+    return one(low), one(high or low)
+
+
+class CountingReader(io.RawIOBase):
+    """ Wraps a binary file and counts the bytes actually read from it. """
+
+    def __init__(self, f):
+        self._f = f
+        self.bytes_read = 0
+
+    def fileno(self):
+        return self._f.fileno()
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self._f.seek(offset, whence)
+
+    def tell(self):
+        return self._f.tell()
+
+    def read(self, size=-1):
+        data = self._f.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def peak_rss_kib() -> int:
+    """ This process's peak resident set size. """
+    # ru_maxrss survives exec on Linux, so a child would report its parent's peak; VmHWM doesn't
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # in KiB on Linux, but bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def extract_once(archive: pathlib.Path, dedupe: str, convert: Optional[str]) -> dict:
+    """ Extract (and convert) one archive in this process, reporting time and peak RSS. """
+    start = time.perf_counter()
+    extracted = afs_extract.afs_extract(archive, dedupe=dedupe)
+    extract_seconds = time.perf_counter() - start
+
+    convert_seconds = None
+    if convert:
+        start = time.perf_counter()
+        for adx, original in extracted:
+            if original is None:
+                afs_extract.convert_filetype(adx, convert)
+        convert_seconds = time.perf_counter() - start
+
+    return {
+        'entries': len(extracted),
+        'unique': sum(original is None for _, original in extracted),
+        'extract_seconds': extract_seconds,
+        'convert_seconds': convert_seconds,
+        'peak_rss_kib': peak_rss_kib(),
+    }
+
+
+def bench(scale: float, convert: Optional[str], dedupe_modes: List[str]):
+    if convert and shutil.which('ffmpeg') is None:
+        sys.stderr.write('ffmpeg not found; skipping conversion.\n')
+        convert = None
+
+    print(f'{"entries":>8} {"size":>15} {"dup":>5} {"dedupe":>6} {"MB":>8} {"MB/s":>9} {"entries/s":>10} '
+          f'{"conv s":>8} {"peak RSS":>10}')
+
+    for entries, low, high, duplicates in SHAPES:
+        entries = max(1, int(entries * scale))
+        for dedupe in dedupe_modes:
+            with tempfile.TemporaryDirectory() as tmp:
+                archive = pathlib.Path(tmp) / 'BENCH.AFS'
+                nbytes = build_archive(archive, entries, (low, high), duplicates=duplicates)
+
+                # a fresh interpreter per case, so peak RSS belongs to that case alone
+                cmd = [sys.executable, __file__, '_extract', str(archive), '--dedupe', dedupe]
+                if convert:
+                    cmd += ['--convert', convert]
+                r = subprocess.run(cmd, capture_output=True, text=True, check=True)
+                result = json.loads(r.stdout.splitlines()[-1])
+
+            mb = nbytes / 1e6
+            seconds = result['extract_seconds']
+            conv = f'{result["convert_seconds"]:8.2f}' if result['convert_seconds'] is not None else f'{"-":>8}'
+            print(
+                f'{entries:8} {f"{low >> 10}-{high >> 10} KiB":>15} {duplicates:5.2f} {dedupe:>6} {mb:8.1f} '
+                f'{mb / seconds:9.1f} {entries / seconds:10.0f} {conv} {result["peak_rss_kib"] / 1024:7.1f} MiB'
+            )
+
+
+def fuzz(rounds: int, time_limit: float = 0.5) -> bool:
+    """ Every corruption must raise AFSError from read_toc(), quickly, having read little more than the TOC. """
+    rng = random.Random(1)
+    ok = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = pathlib.Path(tmp) / 'FUZZ.AFS'
+        for n in range(rounds):
+            corrupt = CORRUPTIONS[n % len(CORRUPTIONS)]
+            entries = rng.randint(1, 300)
+            filesize = build_archive(archive, entries, (64, 4096), duplicates=0.2, corrupt=corrupt, seed=n)
+
+            start = time.perf_counter()
+            with open(archive, 'rb') as f:
+                reader = CountingReader(f)
+                try:
+                    afs_extract.read_toc(reader)
+                    error = None
+                except afs_extract.AFSError as e:
+                    error = e
+            elapsed = time.perf_counter() - start
+
+            budget = 8 + 8 * entries
+            problems = []
+            if error is None:
+                problems.append('was accepted')
+            if reader.bytes_read > budget:
+                problems.append(f'read {reader.bytes_read} bytes (TOC is {budget})')
+            if elapsed > time_limit:
+                problems.append(f'took {elapsed:.3f}s')
+
+            if problems:
+                ok = False
+                print(f'round {n:4} {corrupt:<16} entries={entries:<4} size={filesize:<8} ' + ', '.join(problems))
+
+        # and a clean archive must still extract, with its duplicates detected
+        build_archive(archive, 50, (64, 4096), duplicates=0.5, seed=rounds)
+        with contextlib.redirect_stdout(io.StringIO()):
+            extracted = afs_extract.afs_extract(archive, dedupe='map')
+        if len(extracted) != 50:
+            ok = False
+            print(f'clean archive extracted {len(extracted)} of 50 entries')
+
+    print(f'{rounds} malformed archives: {"all rejected" if ok else "FAILURES above"}')
+    return ok
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    gen = sub.add_parser('generate', help='write one synthetic archive')
+    gen.add_argument('out', type=pathlib.Path)
+    gen.add_argument('-n', '--entries', type=int, default=100)
+    gen.add_argument('-s', '--size', type=parse_size, default=(4096, 65536), help='entry size, e.g. 4k or 4k-64k')
+    gen.add_argument('-a', '--align', type=int, default=2048)
+    gen.add_argument('-d', '--duplicates', type=float, default=0.0, help='fraction of repeated entries')
+    gen.add_argument('-c', '--corrupt', choices=CORRUPTIONS)
+    gen.add_argument('--seed', type=int, default=0)
+
+    b = sub.add_parser('bench', help='measure extraction (and conversion) throughput across archive shapes')
+    b.add_argument('--scale', type=float, default=1.0, help='multiply the entry count of every shape')
+    b.add_argument('-c', '--convert', help='also time ffmpeg conversion to this suffix, e.g. .wav')
+    b.add_argument('--dedupe', nargs='+', default=['none', 'link'], choices=('link', 'map', 'none'))
+
+    f = sub.add_parser('fuzz', help='check that malformed archives are rejected quickly')
+    f.add_argument('--rounds', type=int, default=len(CORRUPTIONS) * 20)
+
+    # used by `bench` to run each case in its own process
+    x = sub.add_parser('_extract')
+    x.add_argument('archive', type=pathlib.Path)
+    x.add_argument('--dedupe', default='link')
+    x.add_argument('--convert')
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_command_line(argv)
+
+    if args.command == 'generate':
+        nbytes = build_archive(
+            args.out, args.entries, args.size, align=args.align,
+            duplicates=args.duplicates, corrupt=args.corrupt, seed=args.seed,
+        )
+        print(f'{args.out}: {args.entries} entries, {nbytes:,} bytes')
+    elif args.command == 'bench':
+        bench(args.scale, args.convert, args.dedupe)
+    elif args.command == 'fuzz':
+        sys.exit(0 if fuzz(args.rounds) else 1)
+    elif args.command == '_extract':
+        # afs_extract prints a line per entry; keep stdout for the result
+        with contextlib.redirect_stdout(sys.stderr):
+            result = extract_once(args.archive, args.dedupe, args.convert)
+        print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main()
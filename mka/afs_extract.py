@@ -1,44 +1,141 @@
 import argparse
 import collections
+import contextlib
+import hashlib
+import json
+import os
 import pathlib
+import sqlite3
+import struct
 import subprocess
 import sys
+from typing import List, Optional, Tuple
 
+try:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+    from buildtools import tracing
+    TRACING = True
+except ImportError:
+    # this script is also published on its own (see deconstruction.html), without buildtools/ beside it
+    class tracing:
+        """ Stand-in for buildtools.tracing whose spans do nothing. """
+
+        @staticmethod
+        @contextlib.contextmanager
+        def span(name, **args):
+            yield args
+
+        @staticmethod
+        @contextlib.contextmanager
+        def session(path):
+            yield None
+
+    TRACING = False
+
+
+# one entry of the archive's table of contents
+ADXHeader = collections.namedtuple('ADXHeader', ('offset', 'size'))
+
+# the parts of an ADX stream's own header that we record in the database
+ADXInfo = collections.namedtuple(
+    'ADXInfo',
+    ('encoding', 'channels', 'sample_rate', 'samples', 'version', 'loop_start', 'loop_end')
+)
+
+
+class AFSError(ValueError):
+    """ The archive is not an AFS file, or its table of contents doesn't fit the file. """
+
+
+def read_toc(afs) -> List[ADXHeader]:
+    """ Read the AFS header and table of contents from the start of an open archive.
+
+    Nothing in the TOC is trusted: the entry count and every offset/size pair are checked against
+    the size of the file before anything is read, so a corrupt archive fails here, immediately,
+    rather than by seeking past the end or allocating gigabytes.
+    """
+    filesize = os.fstat(afs.fileno()).st_size
+
+    # read 8 bytes from file, with the first four bytes
+    # being hdr.id, and the last four bytes being the
+    # number of ADX files in the archive
+    HDR = collections.namedtuple('HDR', ('id', 'num'))
+    hdr = HDR(
+        id=afs.read(4),
+        # assuming little endian because the sample AFS file
+        # I'm working with gives this as "CF 00 00 00", which
+        # is 207 with little endian and 3,472,883,712 with big
+        # endian, which... just feels too big.
+        num=int.from_bytes(afs.read(4), 'little')
+    )
+
+    # We compare hdr.id to the literal bytestring b'AFS\x00'
+    # and when these don't match, we complain that it's not
+    # a proper AFS file.
+    if hdr.id != b'AFS\x00':
+        raise AFSError('Not an AFS file')
+
+    # the TOC itself has to fit in the file before we read it
+    toc_end = 8 + 8 * hdr.num
+    if toc_end > filesize:
+        raise AFSError(f'TOC of {hdr.num} entries needs {toc_end} bytes, but the file is only {filesize}')
+
+    # read blocks of 8 bytes each, assigning them into `idx`
+    idx = [ADXHeader(*entry) for entry in struct.iter_unpack('<II', afs.read(8 * hdr.num))]
+
+    for i, header in enumerate(idx):
+        # empty slots are allowed to point anywhere (usually 0)
+        if header.size == 0:
+            continue
+        if header.offset < toc_end:
+            raise AFSError(f'entry {i} at 0x{header.offset:08X} overlaps the TOC')
+        if header.offset + header.size > filesize:
+            raise AFSError(
+                f'entry {i} (offset=0x{header.offset:08X} size=0x{header.size:08X}) '
+                f'runs past the end of the file (0x{filesize:08X})'
+            )
+
+    return idx
+
+
+CHUNK = 1 << 20
+
+
+def hash_entry(afs, header: ADXHeader) -> bytes:
+    """ SHA-256 of one entry, read in chunks so large entries never sit in memory whole. """
+    h = hashlib.sha256()
+    afs.seek(header.offset)
+    remaining = header.size
+    while remaining:
+        block = afs.read(min(CHUNK, remaining))
+        if not block:
+            break
+        h.update(block)
+        remaining -= len(block)
+    return h.digest()
+
+
+def afs_extract(filepath: pathlib.Path, dedupe: str = 'link') -> List[Tuple[pathlib.Path, Optional[pathlib.Path]]]:
+    """ Extract every entry of the archive beside it, returning (adx file, file it duplicates or None).
+
+    With dedupe='link' or 'map', byte-identical entries are only written once: later copies become
+    hard links to the first one ('link'), or are only listed in {stem}_duplicates.json ('map').
+    dedupe='none' writes every entry.
+    """
+    extracted = []
+    duplicates = {}
 
-def afs_extract(filepath: pathlib.Path):
     with open(filepath, 'rb') as afs:
-        # read 8 bytes from file, with the first four bytes
-        # being hdr.id, and the last four bytes being the
-        # number of ADX files in the archive
-        HDR = collections.namedtuple('HDR', ('id', 'num'))
-        hdr = HDR(
-            id=afs.read(4),
-            # assuming little endian because the sample AFS file
-            # I'm working with gives this as "CF 00 00 00", which
-            # is 207 with little endian and 3,472,883,712 with big
-            # endian, which... just feels too big.
-            num=int.from_bytes(afs.read(4), 'little')
-        )
-
-        # We compare hdr.id to the literal bytestring b'AFS\x00'
-        # and when these don't match, we close the file and complain
-        # that it's not a proper AFS file.
-        if hdr.id != b'AFS\x00':
-            sys.exit('Not an AFS file')
+        idx = read_toc(afs)
 
         # output the file we're extracting from and the number of
         # ADX blocks contained within it
-        print(f'{filepath} - {hdr.num} ADX blocks')
-
-        # read blocks of 8 bytes each, assigning them into `idx`
-        ADXHeader = collections.namedtuple('ADXHeader', ('offset', 'size'))
-        idx = [
-            ADXHeader(
-                offset=int.from_bytes(afs.read(4), 'little'),
-                size=int.from_bytes(afs.read(4), 'little')
-            )
-            for _ in range(hdr.num)
-        ]
+        print(f'{filepath} - {len(idx)} ADX blocks')
+
+        # only entries that share their size with another entry can
+        # be duplicates, so those are the only ones we need to hash
+        sizes = collections.Counter(header.size for header in idx)
+        seen = {}
 
         # now, we loop through each of these ADX "header" structs
         for i, header in enumerate(idx):
@@ -47,7 +144,22 @@ def afs_extract(filepath: pathlib.Path):
             # mode
             outfile = filepath.with_name(f'{filepath.stem}_{i:03}.adx')
 
-            with open(outfile, 'wb') as adx:
+            if dedupe != 'none' and sizes[header.size] > 1:
+                key = (header.size, hash_entry(afs, header))
+                if (original := seen.get(key)) is not None:
+                    print(f'{str(outfile):<50} duplicate of {original.name}')
+                    if dedupe == 'link':
+                        outfile.unlink(missing_ok=True)
+                        os.link(original, outfile)
+                    duplicates[outfile.name] = original.name
+                    extracted.append((outfile, original))
+                    continue
+                seen[key] = outfile
+
+            # don't write through a hard link left by a previous run
+            outfile.unlink(missing_ok=True)
+
+            with tracing.span(str(outfile), cat='write', bytes=header.size), open(outfile, 'wb') as adx:
                 # set the file position of the input stream according
                 # to the data in the header
                 afs.seek(header.offset)
@@ -55,16 +167,100 @@ def afs_extract(filepath: pathlib.Path):
                 # output {destination} {offset} {size}
                 print(f'{str(outfile):<50} offset=0x{header.offset:08X} size=0x{header.size:08X}')
 
-                # read the necessary number of bytes into memory
-                # and write it out to the adx file
-                adx.write(afs.read(header.size))
+                # copy the necessary number of bytes out to the
+                # adx file, a chunk at a time
+                remaining = header.size
+                while remaining:
+                    block = afs.read(min(CHUNK, remaining))
+                    if not block:
+                        break
+                    adx.write(block)
+                    remaining -= len(block)
+
+            extracted.append((outfile, None))
+
+    if dedupe == 'map' and duplicates:
+        mapping = filepath.with_name(f'{filepath.stem}_duplicates.json')
+        mapping.write_text(json.dumps(duplicates, indent=4))
+        print(f'{len(duplicates)} duplicate entries listed in {mapping}')
+
+    return extracted
+
+
+def parse_adx_header(head: bytes) -> Optional[ADXInfo]:
+    """ Decode the start of an ADX stream, or None if it isn't one.
+
+    All fields are big endian. The loop points sit at 0x1C/0x24 in version 3 headers and at
+    0x28/0x30 in version 4, and only exist when the header (which ends 4 bytes before the
+    "(c)CRI" copyright string) is long enough to hold them.
+    """
+    if len(head) < 0x14 or head[:2] != b'\x80\x00':
+        return None
+
+    header_end = int.from_bytes(head[0x02:0x04], 'big') + 4
+    version = head[0x12]
+    info = dict(
+        encoding=head[0x04],
+        channels=head[0x07],
+        sample_rate=int.from_bytes(head[0x08:0x0C], 'big'),
+        samples=int.from_bytes(head[0x0C:0x10], 'big'),
+        version=version,
+        loop_start=None,
+        loop_end=None,
+    )
+
+    # (loop flag, loop start sample, loop end sample) offsets for each header version
+    loops = {3: (0x18, 0x1C, 0x24), 4: (0x24, 0x28, 0x30)}.get(version)
+    if loops and header_end >= loops[2] + 8 and len(head) >= loops[2] + 4:
+        flag, start, end = loops
+        if int.from_bytes(head[flag:flag + 4], 'big'):
+            info['loop_start'] = int.from_bytes(head[start:start + 4], 'big')
+            info['loop_end'] = int.from_bytes(head[end:end + 4], 'big')
+
+    return ADXInfo(**info)
+
+
+def afs_scan(filepath: pathlib.Path) -> List[Tuple[int, ADXInfo]]:
+    """ Read just the ADX header of every entry in the archive, without extracting anything. """
+    found = []
+    with open(filepath, 'rb') as afs:
+        idx = read_toc(afs)
+
+        # visit the entries in file order so the reads only ever move forwards
+        for i, header in sorted(enumerate(idx), key=lambda e: e[1].offset):
+            afs.seek(header.offset)
+            info = parse_adx_header(afs.read(min(header.size, 0x40)))
+            if info is not None:
+                found.append((i, info))
+
+    return sorted(found)
+
+
+def store_headers(database: pathlib.Path, archive: str, headers: List[Tuple[int, ADXInfo]]):
+    """ Replace the "Sound Stream Headers" rows for this archive, all in one transaction. """
+    with sqlite3.connect(database) as conn:
+        with tracing.span(f'store {archive}', cat='sql', rows=len(headers)):
+            conn.execute('DELETE FROM "Sound Stream Headers" WHERE "Archive" = ?;', (archive,))
+            conn.executemany(
+                """
+                INSERT INTO "Sound Stream Headers" (
+                    "Archive", "Track Number", "Encoding", "Channels", "Sample Rate", "Samples",
+                    "Version", "Loop Start", "Loop End"
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+                """,
+                [
+                    (archive, i, h.encoding, h.channels, h.sample_rate, h.samples, h.version, h.loop_start, h.loop_end)
+                    for i, h in headers
+                ]
+            )
 
 
 def convert_filetype(filepath: pathlib.Path, suffix: str) -> int:
     dest = filepath.with_suffix(suffix)
     args = ('ffmpeg', '-i', filepath, dest)
     print(f'Converting {filepath} → {dest}')
-    r = subprocess.run(args, capture_output=True)
+    with tracing.span(f'ffmpeg {filepath.name}', cat='subprocess', dest=str(dest)):
+        r = subprocess.run(args, capture_output=True)
     return r.returncode
 
 
@@ -84,23 +280,66 @@ def parse_command_line():
         dest='remove_adx', action='store_true',
         help='pass this flag to delete the resulting .adx files'
     )
+    parser.add_argument(
+        '-d', '--dedupe',
+        choices=('link', 'map', 'none'), default='link',
+        help='how to store byte-identical entries: as hard links to the first copy (default), '
+             'listed in <archive>_duplicates.json, or written out again'
+    )
+    parser.add_argument(
+        '-s', '--scan',
+        action='store_true',
+        help='instead of extracting, read each entry\'s ADX header and record it in --db'
+    )
+    parser.add_argument(
+        '--db',
+        type=pathlib.Path, default=pathlib.Path(__file__).resolve().parent / 'mkdata.db',
+        help='the database updated by --scan (default: mkdata.db beside this script)'
+    )
+    parser.add_argument(
+        '--trace',
+        type=pathlib.Path, metavar='OUT.json',
+        help='record a Chrome/Perfetto trace of the extraction to this file and print a summary'
+    )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.trace is not None and not TRACING:
+        parser.error('--trace needs the buildtools package from the site\'s repository')
+
+    return args
 
 
 if __name__ == '__main__':
     args = parse_command_line()
 
-    for filename in args.filenames:
-        path = pathlib.Path(filename).resolve()
-        afs_extract(path)
+    with tracing.session(args.trace):
+        try:
+            for filename in args.filenames:
+                path = pathlib.Path(filename).resolve()
+
+                if args.scan:
+                    with tracing.span(f'scan {path.name}'):
+                        headers = afs_scan(path)
+                    store_headers(args.db, path.stem, headers)
+                    print(f'{path} - {len(headers)} ADX headers recorded in {args.db}')
+                    continue
+
+                with tracing.span(f'extract {path.name}'):
+                    extracted = afs_extract(path, dedupe=args.dedupe)
 
-        for adx in path.parent.glob('*.adx'):
-            if args.convert:
-                returncode = convert_filetype(adx, args.convert)
-                if returncode:
-                    sys.stderr.write(f'Error in converting {adx} to *{args.convert}.\n')
+                for adx, original in extracted:
+                    if args.convert:
+                        if original is None:
+                            returncode = convert_filetype(adx, args.convert)
+                            if returncode:
+                                sys.stderr.write(f'Error in converting {adx} to *{args.convert}.\n')
+                        elif args.dedupe == 'link' and original.with_suffix(args.convert).exists():
+                            # duplicates share the converted file of the entry they copy
+                            adx.with_suffix(args.convert).unlink(missing_ok=True)
+                            os.link(original.with_suffix(args.convert), adx.with_suffix(args.convert))
 
-            if args.remove_adx:
-                print(f'Deleting {adx}')
-                adx.unlink()
+                    if args.remove_adx and adx.exists():
+                        print(f'Deleting {adx}')
+                        adx.unlink()
+        except AFSError as e:
+            sys.exit(f'{path}: {e}')
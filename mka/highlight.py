@@ -0,0 +1,141 @@
+import hashlib
+import html
+import pathlib
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+HERE = pathlib.Path(__file__).resolve().parent
+sys.path.append(str(HERE.parent))
+from buildtools.cache import BuildCache  # noqa: E402
+
+CACHE_FILE = HERE / '.cache' / 'highlight.json'
+
+
+def _lexer(rules: List[Tuple[str, str]], flags: int = re.MULTILINE) -> re.Pattern:
+    """ Combine (token type, pattern) rules into one alternation; earlier rules win. """
+    return re.compile('|'.join(f'(?P<t{i}>{pattern})' for i, (_, pattern) in enumerate(rules)), flags)
+
+
+C_KEYWORDS = (
+    'auto break case char const continue default do double else enum extern float for goto if int long '
+    'register return short signed sizeof static struct switch typedef union unsigned void volatile while'
+).split()
+
+PYTHON_KEYWORDS = (
+    'and as assert async await break class continue def del elif else except finally for from global if '
+    'import in is lambda nonlocal not or pass raise return try while with yield'
+).split()
+
+PYTHON_BUILTINS = (
+    'bool bytes dict enumerate filter float int isinstance len list map max min open print range repr set '
+    'sorted str sum super tuple type zip'
+).split()
+
+BASH_KEYWORDS = 'case do done elif else esac fi for function if in then until while'.split()
+BASH_FUNCTIONS = 'cat cd cp echo ffmpeg gcc grep ls mkdir mv python3 rm seq tail'.split()
+
+
+def _words(words: List[str]) -> str:
+    return r'\b(?:' + '|'.join(words) + r')\b'
+
+
+RULES: Dict[str, List[Tuple[str, str]]] = {
+    'bash': [
+        ('comment', r'(?:^|(?<=\s))#.*'),
+        ('string', r'"(?:\\.|[^"\\])*"|\'[^\']*\''),
+        ('variable', r'\$\{[^}\n]*\}|\$\w+|\$[#?@*!0-9]'),
+        ('keyword', _words(BASH_KEYWORDS)),
+        ('function', _words(BASH_FUNCTIONS)),
+        ('operator', r'&&|\|\||[|;&<>]'),
+    ],
+    'c': [
+        ('comment', r'//.*|/\*[\s\S]*?\*/'),
+        ('string', r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''),
+        ('macro property', r'^\s*#\s*\w+'),
+        ('keyword', _words(C_KEYWORDS)),
+        ('function', r'\b[A-Za-z_]\w*(?=\s*\()'),
+        ('number', r'\b0x[\da-fA-F]+\b|\b\d+(?:\.\d+)?\b'),
+        ('operator', r'->|[-+*/%=!<>&|^~?:]+'),
+        ('punctuation', r'[{}[\];(),.]'),
+    ],
+    'python': [
+        ('comment', r'#.*'),
+        ('string', r'[rbfRBF]{0,2}(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\')'),
+        ('decorator', r'^\s*@[\w.]+'),
+        ('keyword', _words(PYTHON_KEYWORDS)),
+        ('boolean', _words(['True', 'False', 'None'])),
+        ('builtin', _words(PYTHON_BUILTINS)),
+        ('function', r'(?<=\bdef )\w+|\b[A-Za-z_]\w*(?=\()'),
+        ('class-name', r'(?<=\bclass )\w+'),
+        ('number', r'\b0x[\da-fA-F]+\b|\b\d[\d_]*(?:\.\d+)?\b'),
+        ('operator', r'->|[-+*/%=!<>&|^~@]+'),
+        ('punctuation', r'[{}[\];(),.:]'),
+    ],
+    'treeview': [
+        ('punctuation', r'[|`]--|\|'),
+        ('dir', r'[^\s|`][^\n]*/$'),
+    ],
+}
+
+LEXERS = {lang: _lexer(rules) for lang, rules in RULES.items()}
+
+
+def highlight(code: str, lang: str) -> str:
+    """ Markup for the plain-text `code`, with each token wrapped in <span class="token ...">.
+    Unknown languages are escaped but otherwise left alone.
+    """
+    lexer = LEXERS.get(lang)
+    if lexer is None:
+        return html.escape(code, quote=False)
+
+    rules = RULES[lang]
+    out = []
+    pos = 0
+    for m in lexer.finditer(code):
+        if m.start() == m.end():
+            continue
+        out.append(html.escape(code[pos:m.start()], quote=False))
+        kind = rules[int(m.lastgroup[1:])][0]
+        out.append(f'<span class="token {kind}">{html.escape(m.group(), quote=False)}</span>')
+        pos = m.end()
+    out.append(html.escape(code[pos:], quote=False))
+
+    return ''.join(out)
+
+
+def highlighter_version() -> str:
+    return hashlib.sha256(pathlib.Path(__file__).read_bytes()).hexdigest()
+
+
+class BlockCache(BuildCache):
+    """ Highlighted blocks from previous builds, keyed on the SHA-256 of the language and source text. """
+
+    def __init__(self, path: pathlib.Path = CACHE_FILE):
+        super().__init__(path, highlighter_version())
+
+    def highlight(self, code: str, lang: str) -> str:
+        key = hashlib.sha256(f'{lang}\0{code}'.encode()).hexdigest()
+        if (markup := self.get(key)) is None:
+            markup = highlight(code, lang)
+            self.put(key, markup)
+        return markup
+
+
+CODE_BLOCK = re.compile(r'(<code class="language-(?P<lang>[\w-]+)">)(?P<body>.*?)(</code>)', re.DOTALL)
+
+
+def highlight_page(page: str, cache: Optional[BlockCache] = None) -> str:
+    """ Highlight every <code class="language-*"> block in `page`.
+
+    Any markup already inside a block is stripped back to plain text first, so running this over
+    its own output gives the same result, and the page can be edited and rebuilt in place.
+    """
+    def repl(m: re.Match) -> str:
+        code = html.unescape(re.sub(r'<[^>]*>', '', m.group('body')))
+        lang = m.group('lang')
+        markup = cache.highlight(code, lang) if cache is not None else highlight(code, lang)
+        return m.group(1) + markup + m.group(4)
+
+    return CODE_BLOCK.sub(repl, page)
@@ -1,22 +1,26 @@
+import argparse
 import contextlib
+import functools
 import html
 import io
 import json
 import pathlib
 import re
 import sqlite3
+import sys
 from typing import Optional, Tuple
 
 
 HERE = pathlib.Path(__file__).resolve().parent
 DB = HERE / 'mkdata.db'
 
+sys.path.append(str(HERE.parent))
+from buildtools import images, output, styles, tracing  # noqa: E402
+
 
 def db_query(database: pathlib.Path, sql: str, args: Optional[Tuple[str]] = None):
     with sqlite3.connect(database) as conn:
-        c = conn.cursor()
-        records = c.execute(sql, args or tuple())
-        columns = tuple(z[0] for z in records.description)
+        columns, records = tracing.query(conn, sql, args or tuple())
 
         return columns, tuple(records)
 
@@ -35,7 +39,7 @@ class HTMLWriter:
         return text
 
     def export_to(self, path: pathlib.Path):
-        pathlib.Path(path).write_text(str(self))
+        output.write(path, str(self))
 
     @contextlib.contextmanager
     def wraptag(self, tag, **kwargs):
@@ -73,6 +77,7 @@ class HTMLWriter:
                 pass
 
     @staticmethod
+    @tracing.timed('HTMLWriter._parse')
     def _parse(value, comma_to_list: bool = True):
         if isinstance(value, str):
             value = html.escape(value, quote=False)
@@ -101,7 +106,7 @@ class HTMLWriter:
         args: Optional[Tuple[str]] = None,
         comma_to_list: bool = True
     ):
-        columns, records = db_query(DB, sql, args or tuple())
+        columns, records = db_query(db, sql, args or tuple())
         with self.wraptag('table', style='width: 100%;'):
             each, marginal = divmod(100, len(columns))
 
@@ -141,7 +146,18 @@ class HTMLWriter:
             ''')
 
 
-SQL_LOOKUPS = json.loads((HERE / 'htmlify.json').read_text())
+@functools.lru_cache(maxsize=None)
+def sql_lookups() -> dict:
+    """ The queries behind each table, from htmlify.json. Loaded on first use rather than at import. """
+    return json.loads((HERE / 'htmlify.json').read_text())
+
+
+def sound_stream_lookup() -> Tuple[str, bool]:
+    """ The Sound Stream query, with the Duration/Format/Loop columns only once afs_extract.py --scan
+    has filled in "Sound Stream Headers"; until then they'd just be empty.
+    """
+    _, ((scanned,),) = db_query(DB, 'SELECT EXISTS (SELECT 1 FROM "Sound Stream Headers");')
+    return sql_lookups()['SOUND-STREAM-HEADERS' if scanned else 'SOUND-STREAM']
 
 
 def write_minimal_battles(w: HTMLWriter):
@@ -304,7 +320,7 @@ def write_minimal_battles(w: HTMLWriter):
         """)
 
 
-def write_data():
+def render_data() -> str:
     w = HTMLWriter()
     with w.wraptag('html'):
         with w.wraptag('head'):
@@ -329,7 +345,7 @@ def write_data():
                 w.write('Recipe Data')
             for cat in ('Usable', 'Material', 'Weapon', 'Armor', 'Accessory', 'Key'):
                 with w.collapsible(header=cat, id_=f'{cat.lower()}-recipes'):
-                    sql, ctl = SQL_LOOKUPS[cat]
+                    sql, ctl = sql_lookups()[cat]
                     w.database_query(DB, sql=sql, comma_to_list=ctl)
 
             # other data
@@ -338,18 +354,24 @@ def write_data():
 
             for cat in ('Nonsynthesizable Item', 'Enemy', 'Course', 'Job', 'Gossip Shop', 'SOUND-STREAM'):
                 with w.collapsible(header=f'{cat} Data', id_=f'{cat.lower()}-data'):
-                    sql, ctl = SQL_LOOKUPS[cat]
+                    sql, ctl = sound_stream_lookup() if cat == 'SOUND-STREAM' else sql_lookups()[cat]
                     w.database_query(DB, sql=sql, comma_to_list=ctl)
 
             # minimal battles
             write_minimal_battles(w)
 
     w.allow_collapsible()
-    w.export_to(HERE / 'data.html')
+    return styles.inline_css(fix_image_tags(str(w)), HERE)
+
+
+def write_data():
+    with tracing.span('render data'):
+        page = render_data()
+    output.write(HERE / 'data.html', page)
 
 
 def write_endings(w: HTMLWriter, character: str):
-    sql, ctl = SQL_LOOKUPS['Character Ending']
+    sql, ctl = sql_lookups()['Character Ending']
     _, records = db_query(DB, sql, args=(character,))
 
     def _write_row(icon, text):
@@ -364,14 +386,18 @@ def write_endings(w: HTMLWriter, character: str):
         with w.wraptag('table', style='width: 100%;'):
             for speaker, line in records:
                 if (HERE / (p := f'imgs/{speaker}.png'.lower().replace(' ', '-'))).exists():
-                    speaker = f'<img src="{p}" width="75">'
+                    speaker = images.img_tag(p, HERE, sizes='75px', width=75)
 
                 with w.wraptag('tr'):
                     text = w._parse(line, comma_to_list=False)
                     _write_row(speaker, text)
 
 
-def write_character_quests():
+def portrait(char: str) -> str:
+    return images.img_tag(f'imgs/{char.lower()}.png', HERE, sizes='100px', width=100)
+
+
+def render_character_quests() -> str:
     w = HTMLWriter()
 
     with w.wraptag('html'):
@@ -390,12 +416,12 @@ def write_character_quests():
         with w.wraptag('body', style='font-family: Montserrat, sans-serif;'):
             for char in ('Philo', 'Nikki', 'Pamela', 'Flay', 'Roxis', 'Anna', 'Muppy'):
                 with w.collapsible(
-                    header=f'<img src="imgs/{char.lower()}.png" width="100"> {char}',
+                    header=f'{portrait(char)} {char}',
                     class_=f'cq-{char.lower()}', id_=f'cq-{char.lower()}'
                 ):
                     with w.wraptag('h2'):
                         w.write('CQ Episodes')
-                    sql, ctl = SQL_LOOKUPS['Character Quest']
+                    sql, ctl = sql_lookups()['Character Quest']
                     w.database_query(DB, sql, args=(char,), comma_to_list=ctl)
 
                     with w.wraptag('h2'):
@@ -405,7 +431,7 @@ def write_character_quests():
             # add Vayne ending
             char = 'Vayne'
             with w.collapsible(
-                    header=f'<img src="imgs/{char.lower()}.png" width="100"> {char}',
+                    header=f'{portrait(char)} {char}',
                     class_=f'cq-{char.lower()}', id_=f'cq-{char.lower()}'
             ):
                 with w.wraptag('h2'):
@@ -413,18 +439,77 @@ def write_character_quests():
                 write_endings(w, character=char)
 
     w.allow_collapsible()
-    w.export_to(HERE / 'character-quests.html')
+    return styles.inline_css(str(w), HERE)
+
+
+def write_character_quests():
+    with tracing.span('render character-quests'):
+        page = render_character_quests()
+    output.write(HERE / 'character-quests.html', page)
+
+
+def fix_image_tags(text: str) -> str:
+    """ Undo the escaping of <img> tags that come out of the database (e.g., the required-course icon). """
+    return re.sub(r'&lt;(img.*?)&gt;', '<\g<1>>', text)     # noqa E605
+
+
+def write_deconstruction():
+    """ Highlight the code blocks in deconstruction.html in place, replacing the prism.js runtime. """
+    import highlight
+
+    path = HERE / 'deconstruction.html'
+    page = path.read_text()
+
+    page = page.replace('<link href="../prism.css" rel="stylesheet">', '<link href="highlight.css" rel="stylesheet">')
+    page = re.sub(r'[ \t]*<script src="\.\./prism\.js"></script>\n', '', page)
+
+    cache = highlight.BlockCache()
+    with tracing.span('highlight deconstruction'):
+        page = highlight.highlight_page(page, cache)
+    cache.save()
+    page = styles.inline_css(page, HERE)
+
+    output.write(path, page)
+
+
+TARGETS = {
+    'data': write_data,
+    'character-quests': write_character_quests,
+    'deconstruction': write_deconstruction,
+}
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'targets',
+        nargs='*', metavar='target',
+        help=f'the pages to build, any of {{{", ".join(TARGETS)}}} (default: all of them)'
+    )
+    parser.add_argument(
+        '--trace',
+        type=pathlib.Path, metavar='OUT.json',
+        help='record a Chrome/Perfetto trace of the build to this file and print a summary'
+    )
+
+    args = parser.parse_args(argv)
+    for target in args.targets:
+        if target not in TARGETS:
+            parser.error(f'unknown target {target!r}')
+
+    return args
+
 
+def main(argv=None):
+    args = parse_command_line(argv)
 
-def fix_image_tags():
-    with open(HERE / 'data.html') as f:
-        data = f.read()
-    data = re.sub(r'&lt;(img.*?)&gt;', '<\g<1>>', data)     # noqa E605
+    with tracing.session(args.trace):
+        for target in args.targets or TARGETS:
+            with tracing.span(target, cat='target'):
+                TARGETS[target]()
 
-    with open(HERE / 'data.html', 'w+') as f:
-        f.write(data)
+    print(output.summary())
 
 
-write_data()
-write_character_quests()
-fix_image_tags()
+if __name__ == '__main__':
+    main()
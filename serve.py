@@ -0,0 +1,236 @@
+""" Local preview server that renders the generated pages on request.
+
+Pages are rendered from the live databases and sources with the generators' own render
+functions, then cached in memory under a key built from each input's SQLite data_version and
+file mtimes. A page is only re-rendered when one of its inputs changes. Every response carries
+an ETag, so a browser's revalidation gets a 304 while nothing has changed. A page that fails to
+render is answered with a 500 carrying the traceback. Anything that isn't a generated page is
+served from disk as usual.
+"""
+import argparse
+import functools
+import hashlib
+import http
+import http.server
+import pathlib
+import sqlite3
+import sys
+import threading
+import traceback
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+HERE = pathlib.Path(__file__).resolve().parent
+for sub in ('trophies', 'mka', 'hfa'):
+    sys.path.append(str(HERE / sub))
+
+import htmlify  # noqa: E402
+import poem_builder  # noqa: E402
+import trophy_builder  # noqa: E402
+
+
+class Database:
+    """ A connection kept open only to watch for changes: PRAGMA data_version moves whenever another
+    connection commits, and the file's mtime catches the database being replaced outright.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+    def version(self) -> Tuple[int, int]:
+        with self._lock:
+            data_version, = self._conn.execute('PRAGMA data_version;').fetchone()
+        return data_version, self.path.stat().st_mtime_ns
+
+
+def mtimes(*paths: pathlib.Path) -> Tuple[Tuple[str, int], ...]:
+    return tuple((str(p), p.stat().st_mtime_ns if p.exists() else 0) for p in paths)
+
+
+class Page:
+    def __init__(self, key: Callable[[], Hashable], render: Callable[[], str], content_type: str = 'text/html'):
+        self.key = key
+        self.render = render
+        self.content_type = content_type
+
+
+class PageCache:
+    def __init__(self, pages: Dict[str, Page]):
+        self.pages = pages
+        self._cache: Dict[str, Tuple[Hashable, bytes, str]] = {}
+        self._lock = threading.Lock()
+        # held while a route renders, so concurrent requests for a stale page render it once
+        self._route_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, route: str) -> Optional[Tuple[bytes, str, str]]:
+        """ (body, etag, content type) for a generated page, re-rendering it only if its key has changed. """
+        page = self.pages.get(route)
+        if page is None:
+            return None
+
+        with self._lock:
+            route_lock = self._route_locks.setdefault(route, threading.Lock())
+
+        with route_lock:
+            # a request that waited on the lock finds the page the other one rendered
+            key = page.key()
+            with self._lock:
+                cached = self._cache.get(route)
+            if cached is not None and cached[0] == key:
+                return cached[1], cached[2], page.content_type
+
+            body = page.render().encode('utf-8')
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            with self._lock:
+                self._cache[route] = (key, body, etag)
+
+        print(f'rendered {route} ({len(body):,} bytes)')
+        return body, etag, page.content_type
+
+
+def declare_pages() -> Dict[str, Page]:
+    databases = trophy_builder.default_databases()
+    trophy_dbs = [Database(db) for db in databases]
+    mk_db = Database(htmlify.DB)
+    manifests = sorted(HERE.glob('*/imgs/sized/manifest.json'))
+    # inlined into every page, along with fonts/fonts.css
+    stylesheets = sorted(HERE.glob('*/*.css'))
+
+    def trophies_key():
+        return tuple(db.version() for db in trophy_dbs), mtimes(*manifests, *stylesheets)
+
+    def load_game(table: str, database: pathlib.Path) -> dict:
+        """ One game's definitions from the main database, with `database`'s progress. """
+        game, = (g for g in trophy_builder.get_definitions(databases[0]) if g['TableName'] == table)
+        return trophy_builder.with_progress(game, trophy_builder.get_progress(database, [table]))
+
+    def render_trophies(table: str, database: pathlib.Path) -> str:
+        return trophy_builder.render_game(load_game(table, database))
+
+    def render_comparison(table: str) -> str:
+        profiles = {trophy_builder.profile_name(db): load_game(table, db) for db in databases}
+        return trophy_builder.render_comparison(next(iter(profiles.values())), profiles)
+
+    def htmlify_key():
+        return mk_db.version(), mtimes(HERE / 'mka' / 'htmlify.json', *manifests, *stylesheets)
+
+    def render_htmlify(render: Callable[[], str]) -> str:
+        # htmlify.json may have changed since it was last loaded
+        htmlify.sql_lookups.cache_clear()
+        return render()
+
+    def poems_key():
+        return mtimes(*sorted((poem_builder.HERE / 'poems').iterdir()), *stylesheets)
+
+    def render_poems() -> str:
+        return poem_builder.render_page(poem_builder.render_all())
+
+    pages = {
+        '/mka/data.html': Page(htmlify_key, functools.partial(render_htmlify, htmlify.render_data)),
+        '/mka/character-quests.html': Page(htmlify_key, functools.partial(render_htmlify, htmlify.render_character_quests)),
+        '/hfa/home.html': Page(poems_key, render_poems),
+        '/styles/trophy-icons.css': Page(
+            lambda: mtimes(*sorted(trophy_builder.HERE.glob('*.png'))),
+            trophy_builder.render_icon_css,
+            content_type='text/css',
+        ),
+    }
+
+    with sqlite3.connect(databases[0]) as conn:
+        games = conn.execute('SELECT TableName, FolderName FROM GAMELOOKUP;').fetchall()
+    for table, folder in games:
+        for db in databases:
+            page = trophy_builder.page_name(trophy_builder.profile_name(db))
+            pages[f'/{folder}/{page}'] = Page(trophies_key, functools.partial(render_trophies, table, db))
+        if len(databases) > 1:
+            pages[f'/{folder}/{trophy_builder.COMPARE_PAGE}'] = Page(
+                trophies_key, functools.partial(render_comparison, table)
+            )
+
+    return pages
+
+
+class Handler(http.server.SimpleHTTPRequestHandler):
+    pages: PageCache
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(HERE), **kwargs)
+
+    def _generated(self, head_only: bool = False) -> bool:
+        route = self.path.split('?', 1)[0].split('#', 1)[0]
+        try:
+            result = self.pages.get(route)
+        except Exception:
+            # show what broke in the browser rather than dropping the connection
+            self.log_error('rendering %s failed', route)
+            self._send(http.HTTPStatus.INTERNAL_SERVER_ERROR, traceback.format_exc().encode('utf-8'), 'text/plain',
+                       head_only)
+            return True
+        if result is None:
+            return False
+
+        body, etag, content_type = result
+        if etag in (tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')):
+            self.send_response(http.HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return True
+
+        self._send(http.HTTPStatus.OK, body, content_type, head_only, etag=etag)
+        return True
+
+    def _send(
+        self, status: http.HTTPStatus, body: bytes, content_type: str, head_only: bool, etag: Optional[str] = None,
+    ):
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        if not self._generated():
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self._generated(head_only=True):
+            super().do_HEAD()
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '-b', '--bind',
+        default='127.0.0.1',
+        help='address to listen on (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '-p', '--port',
+        type=int, default=8000,
+        help='port to listen on (default: 8000)'
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_command_line(argv)
+
+    Handler.pages = PageCache(declare_pages())
+    with http.server.ThreadingHTTPServer((args.bind, args.port), Handler) as server:
+        print(f'Serving {HERE} on http://{args.bind}:{args.port}/ '
+              f'({len(Handler.pages.pages)} pages rendered on demand)')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
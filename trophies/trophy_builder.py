@@ -0,0 +1,562 @@
+import argparse
+import base64
+import collections
+import concurrent.futures
+import contextlib
+import datetime
+import enum
+import hashlib
+import io
+import json
+import pathlib
+import sqlite3
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+HERE = pathlib.Path(__file__).resolve().parent
+sys.path.append(str(HERE.parent))
+from buildtools import images, output, styles, tracing  # noqa: E402
+from buildtools.cache import BuildCache  # noqa: E402
+
+DBFILENAME = HERE / pathlib.Path("trophies.db")
+# further players' copies of trophies.db, each built into trophies-<name>.html beside the main pages
+PROFILES_DIR = HERE / "profiles"
+COMPARE_PAGE = "trophies-compare.html"
+CACHE_FILE = HERE / ".cache" / "pages.json"
+ICON_CSS = HERE.parent / "styles" / "trophy-icons.css"
+
+
+class TrophyLevel(enum.Enum):
+    BRONZE = dict(id=0, score=15)
+    SILVER = dict(id=1, score=30)
+    GOLD = dict(id=2, score=90)
+    PLATINUM = dict(id=3, score=180)
+
+    @classmethod
+    def from_id(cls, id: int):
+        for level in cls:
+            if level.value["id"] == id:
+                return level
+        else:
+            raise ValueError("No TrophyLevel found with id={id!r}")
+
+    @classmethod
+    def descending(cls):
+        return sorted(cls, key=lambda e: e.value["id"], reverse=True)
+
+
+class Trophy:
+    def __init__(
+        self,
+        img_source: str,  # link to trophy icon image
+        name: str,  # name of trophy
+        description: str,  # required task
+        details: Optional[str],  # any additional details
+        obtained: Optional[str],  # date/time it was obtained (None for unobtained)
+        level: int,  # level (0 for bronze, ...)
+    ):
+        self.img_source = img_source
+        self.name = name
+        self.description = description
+        self.details = details
+        self.obtained = self.parse_obtained(obtained)
+        self.level = TrophyLevel.from_id(level)
+
+    @staticmethod
+    @tracing.timed('Trophy.parse_obtained')
+    def parse_obtained(obtained):
+        if obtained is None:
+            return ''
+        if obtained == '✓':
+            return '✓'
+        return datetime.datetime.strptime(obtained, "%m/%d/%Y %H:%M")
+
+    @property
+    def score(self):
+        """ The number of points earned for this trophy. """
+        return self.level.value["score"] if self.obtained else 0
+
+    @property
+    def weight(self):
+        """ The total number of points possible for achieving this trophy. """
+        return self.level.value["score"]
+
+
+def get_definitions(dbfilename: pathlib.Path) -> List[dict]:
+    """ GAMELOOKUP, with each game's trophy rows (every column but Obtained) under "definitions". """
+    with contextlib.closing(sqlite3.connect(dbfilename)) as conn:
+        columns, result = tracing.query(conn, "SELECT * FROM GAMELOOKUP;")
+        games = [dict(zip(columns, game)) for game in result]
+
+        for game in games:
+            _, game["definitions"] = tracing.query(
+                conn, f"SELECT ID, ImageSource, TrophyName, Description, Details, Level FROM {game['TableName']}"
+            )
+
+        return games
+
+
+def get_progress(dbfilename: pathlib.Path, tables: Iterable[str]) -> Dict[str, Dict[int, Optional[str]]]:
+    """ The Obtained column of each table, by trophy ID. """
+    with contextlib.closing(sqlite3.connect(dbfilename)) as conn:
+        return {table: dict(tracing.query(conn, f"SELECT ID, Obtained FROM {table}")[1]) for table in tables}
+
+
+def with_progress(game: dict, progress: Dict[str, Dict[int, Optional[str]]]) -> dict:
+    """ A copy of `game` whose "trophies" combine its shared definitions with one profile's progress. """
+    obtained = progress.get(game["TableName"], {})
+    trophies = [
+        Trophy(img_source, name, description, details, obtained.get(id_), level)
+        for id_, img_source, name, description, details, level in game["definitions"]
+    ]
+    return {**game, "trophies": trophies}
+
+
+def load_profiles(
+    databases: Sequence[pathlib.Path],
+) -> Tuple[List[dict], Dict[str, Dict[str, Dict[int, Optional[str]]]]]:
+    """ The trophy definitions, read once from the first database, and every database's progress,
+    keyed on its profile name. The databases are read concurrently.
+    """
+    games = get_definitions(databases[0])
+    tables = [game["TableName"] for game in games]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(databases)) as pool:
+        futures = {profile_name(db): pool.submit(get_progress, db, tables) for db in databases}
+    return games, {name: future.result() for name, future in futures.items()}
+
+
+def profile_name(dbfilename: pathlib.Path) -> str:
+    return dbfilename.stem
+
+
+def page_name(profile: str) -> str:
+    """ The file each profile's pages are written to; the main database keeps trophies.html. """
+    return "trophies.html" if profile == profile_name(DBFILENAME) else f"trophies-{profile}.html"
+
+
+def page_digest(game: dict, progress: Sequence[Dict[str, Dict[int, Optional[str]]]]) -> str:
+    """ Hash of everything a page for `game` is rendered from, given the progress of its profiles. """
+    rows = [sorted(p.get(game["TableName"], {}).items()) for p in progress]
+    data = [game["FolderName"], game["GameName"], game["definitions"], rows]
+    return hashlib.sha256(json.dumps(data).encode("utf-8")).hexdigest()
+
+
+def builder_version() -> str:
+    """ Hash of the builder and everything its pages embed besides the databases. """
+    sources = [
+        pathlib.Path(__file__), *sorted((HERE.parent / "buildtools").glob("*.py")),
+        *sorted((HERE.parent / "styles").glob("*.css")), *sorted(HERE.parent.glob("fonts/fonts.css")),
+        *sorted(HERE.parent.glob("*/imgs/sized/manifest.json")),
+    ]
+    h = hashlib.sha256()
+    for source in sources:
+        h.update(source.read_bytes())
+    return h.hexdigest()
+
+
+class PageCache(BuildCache):
+    """ The digest each page was last rendered from, and the hash of what was written, so pages whose
+    rows haven't changed are skipped as long as the file on disk is still the one the build wrote.
+    """
+
+    def fresh(self, page: pathlib.Path, digest: str) -> bool:
+        key = str(page.relative_to(HERE.parent))
+        entry = self._entries.get(key)
+        try:
+            written = hashlib.sha256(page.read_bytes()).hexdigest()
+        except OSError:
+            written = None
+
+        if entry == [digest, written]:
+            self.hits += 1
+            self._used[key] = entry
+            return True
+
+        self.misses += 1
+        return False
+
+    def put(self, page: pathlib.Path, digest: str, content: str):
+        written = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        super().put(str(page.relative_to(HERE.parent)), [digest, written])
+
+    def save(self):
+        # a run limited to some games keeps the others' entries; only pages that are gone are dropped
+        self._entries = {key: entry for key, entry in self._entries.items() if (HERE.parent / key).exists()}
+        super().save(prune=False)
+
+
+def count_trophies(trophies):
+    result = collections.defaultdict(lambda: collections.defaultdict(int))
+    for trophy in trophies:
+        result[trophy.level]["total"] += 1
+        result[trophy.level]["obtained"] += int(bool(trophy.obtained))
+
+    return result
+
+
+def render_icon_css(icon_dir: pathlib.Path = HERE) -> str:
+    """ A stylesheet with one class per icon in icon_dir, each embedding its PNG as a data URI.
+
+    Every trophy page links this one file instead of requesting each icon separately.
+    """
+    rules = [
+        "/* generated by trophies/trophy_builder.py from trophies/*.png; do not edit */",
+        ".icon { display: inline-block; vertical-align: middle; background: no-repeat center / contain; }",
+        # icons in trophy rows scale with their cell, like the old width="90%" images
+        "tr.trophy-obtained .icon, tr.trophy-unobtained .icon, tr.trophy-compare .icon { width: 90%; height: auto; }",
+    ]
+    for png in sorted(icon_dir.glob("*.png")):
+        width, height = images.png_size(png) or (40, 40)
+        data = base64.b64encode(png.read_bytes()).decode("ascii")
+        rules.append(
+            f".icon-{png.stem} {{ width: {width}px; height: {height}px; aspect-ratio: {width} / {height}; "
+            f"background-image: url(data:image/png;base64,{data}); }}"
+        )
+
+    return "\n".join(rules) + "\n"
+
+
+def icon_tag(name: str, label: str) -> str:
+    """ An element showing one of the icons from render_icon_css(). """
+    return f'<i class="icon icon-{name}" title="{label}"></i>'
+
+
+def write_head(stream: io.StringIO, title: str):
+    stream.write(
+        f"""\
+<html>
+
+<head>
+    <title>
+        {title}
+    </title>
+    <link href="https://fonts.googleapis.com/css?family=Tangerine" rel="stylesheet" />
+    <link href="https://fonts.googleapis.com/css?family=Montserrat" rel="stylesheet" />
+    <link href="../styles/base-style.css" rel="stylesheet" />
+    <link href="../styles/trophies.css" rel="stylesheet" />
+    <link href="../styles/trophy-icons.css" rel="stylesheet" />
+    <link href="../styles/w3-subset.css" rel="stylesheet" />
+    <link rel="icon" href="../favicon.png" type="image/x-icon">
+</head>"""
+    )
+
+
+def write_header(stream: io.StringIO, game: dict):
+    write_head(stream, f"{game['GameName']} Trophies")
+
+    counts = count_trophies(game["trophies"])
+    obtained = sum(v["obtained"] for v in counts.values())
+    total = sum(v["total"] for v in counts.values())
+
+    stream.write(
+        f"""
+<body style="font-family: Montserrat, sans-serif;">
+    <div>
+        <!-- header -->
+        <table class="zebra">
+            <tr>
+                <td width="10%" style="text-align: center;"><img src="imgs/gamelogo.png" width="95%"></td>
+                <td width="75%"><b style="font-size: 200%;">{game['GameName']}</b></td>
+                <td width="3%">{icon_tag("complete-icon-on", "complete") if obtained == total else icon_tag("complete-icon-off", "incomplete")}</td>
+                <td width="13%;">{obtained}/{total} trophies obtained</td>
+            </tr>
+            <tr>
+                <td></td>
+                <td>"""
+    )
+
+    for level in TrophyLevel.descending():
+        a = counts[level]["obtained"]
+        b = counts[level]["total"]
+        stream.write(
+            f"""
+                    {icon_tag(f"40-{level.name.lower()}", level.name.lower())} {a}/{b}
+"""
+        )
+    stream.write(
+        """
+                </td>
+            </tr>
+        </table>
+"""
+    )
+
+
+def format_obtained(trophy: Trophy) -> str:
+    if trophy.obtained:
+        if isinstance(trophy.obtained, datetime.datetime):
+            return trophy.obtained.strftime('%m/%d/%Y %H:%M')
+        # not a datetime object
+        return str(trophy.obtained)
+    return ''
+
+
+def trophy_icon(trophy: Trophy, folder: Optional[pathlib.Path] = None) -> str:
+    """ The trophy's own icon. `folder` is the page's directory, used to find local trophy icons. """
+    if folder is not None:
+        return images.img_tag(trophy.img_source, folder, sizes="5vw", style="width: 70%; height: auto;")
+    return f'<img src="{trophy.img_source}" width="70%">'
+
+
+def write_trophies(stream: io.StringIO, trophies: List[Trophy], folder: Optional[pathlib.Path] = None):
+    """ Write the trophy table. `folder` is the page's directory, used to find local trophy icons. """
+    stream.write('<table class="zebra">')
+
+    for trophy in trophies:
+        details = f'<br/><span class="detail">{trophy.details}</span>' if trophy.details else ''
+        obtained = format_obtained(trophy)
+        icon = trophy_icon(trophy, folder)
+        stream.write(
+            f"""
+    <tr class="trophy-{'obtained' if trophy.obtained else 'unobtained'}">
+        <td width="7%" style="text-align: center;">
+                    {icon}
+                </td>
+                <td width="75%">
+                    <p>
+                        <b>{trophy.name}</b><br />
+                        <i>{trophy.description}</i>{details}
+                    </p>
+                </td>
+                <td width="15%" style="text-align: center;">
+                    {obtained}
+                </td>
+                <td width="3%">
+                    {icon_tag(f"40-{trophy.level.name.lower()}", trophy.level.name.lower())}
+                </td>
+            </tr>
+""")
+
+    stream.write("</table>")
+
+
+def render_game(game: dict) -> str:
+    """ The full trophies page for one game and profile, as returned by with_progress(). """
+    stream = io.StringIO()
+
+    write_header(stream, game)
+    write_trophies(stream, game["trophies"], folder=HERE.parent / game["FolderName"])
+    stream.write('''</div>
+
+    <div style="padding-top: 100px;">
+    </div>
+
+</body>
+
+</html>''')
+
+    # the icons are a few dozen KB of data URIs, so they load after the first paint
+    return styles.inline_css(
+        stream.getvalue(), HERE.parent / game["FolderName"], defer=("../styles/trophy-icons.css",)
+    )
+
+
+def write_comparison_header(stream: io.StringIO, game: dict, profiles: Dict[str, dict]):
+    """ One row per profile: a link to its page, its progress and its score. """
+    write_head(stream, f"{game['GameName']} Trophies: Comparison")
+    stream.write(
+        f"""
+<body style="font-family: Montserrat, sans-serif;">
+    <div>
+        <!-- header -->
+        <table class="zebra">
+            <tr>
+                <td width="10%" style="text-align: center;"><img src="imgs/gamelogo.png" width="95%"></td>
+                <td colspan="4"><b style="font-size: 200%;">{game['GameName']}</b></td>
+            </tr>"""
+    )
+
+    for name, data in profiles.items():
+        trophies = data["trophies"]
+        counts = count_trophies(trophies)
+        obtained = sum(v["obtained"] for v in counts.values())
+        levels = " ".join(
+            f'{icon_tag(f"40-{level.name.lower()}", level.name.lower())} '
+            f'{counts[level]["obtained"]}/{counts[level]["total"]}'
+            for level in TrophyLevel.descending()
+        )
+        if obtained == len(trophies):
+            complete = icon_tag("complete-icon-on", "complete")
+        else:
+            complete = icon_tag("complete-icon-off", "incomplete")
+        stream.write(
+            f"""
+            <tr>
+                <td><a href="{page_name(name)}">{name}</a></td>
+                <td width="3%">{complete}</td>
+                <td>{obtained}/{len(trophies)} trophies obtained</td>
+                <td>{levels}</td>
+                <td>{sum(t.score for t in trophies)}/{sum(t.weight for t in trophies)} points</td>
+            </tr>"""
+        )
+
+    stream.write(
+        """
+        </table>
+"""
+    )
+
+
+def write_comparison(stream: io.StringIO, profiles: Dict[str, dict], folder: Optional[pathlib.Path] = None):
+    """ Write the trophy table with a column per profile, showing when (and whether) each obtained it. """
+    stream.write('<table class="zebra">')
+
+    names = list(profiles)
+    stream.write(
+        "\n    <tr>\n        <td></td>\n        <td></td>\n"
+        + "".join(f'        <td style="text-align: center;"><b>{name}</b></td>\n' for name in names)
+        + "        <td></td>\n    </tr>\n"
+    )
+
+    # every profile shares the same definitions, so the rows line up
+    for trophies in zip(*(profiles[name]["trophies"] for name in names)):
+        trophy = trophies[0]
+        details = f'<br/><span class="detail">{trophy.details}</span>' if trophy.details else ''
+        cells = "".join(
+            f"""
+                <td class="trophy-{'obtained' if t.obtained else 'unobtained'}" style="text-align: center;">
+                    {format_obtained(t)}
+                </td>"""
+            for t in trophies
+        )
+        stream.write(
+            f"""
+    <tr class="trophy-compare">
+        <td width="7%" style="text-align: center;">
+                    {trophy_icon(trophy, folder)}
+                </td>
+                <td>
+                    <p>
+                        <b>{trophy.name}</b><br />
+                        <i>{trophy.description}</i>{details}
+                    </p>
+                </td>{cells}
+                <td width="3%">
+                    {icon_tag(f"40-{trophy.level.name.lower()}", trophy.level.name.lower())}
+                </td>
+            </tr>
+""")
+
+    stream.write("</table>")
+
+
+def render_comparison(game: dict, profiles: Dict[str, dict]) -> str:
+    """ The trophies-compare.html page for one game, given its data (from with_progress()) per profile. """
+    stream = io.StringIO()
+    folder = HERE.parent / game["FolderName"]
+
+    write_comparison_header(stream, game, profiles)
+    write_comparison(stream, profiles, folder=folder)
+    stream.write('''</div>
+
+    <div style="padding-top: 100px;">
+    </div>
+
+</body>
+
+</html>''')
+
+    return styles.inline_css(stream.getvalue(), folder, defer=("../styles/trophy-icons.css",))
+
+
+def default_databases() -> List[pathlib.Path]:
+    return [DBFILENAME, *sorted(PROFILES_DIR.glob("*.db"))]
+
+
+def parse_command_line(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "games",
+        nargs="*", metavar="game",
+        help="the TableName of each game to build, e.g. MK1 (default: every game in GAMELOOKUP)"
+    )
+    parser.add_argument(
+        "-d", "--db",
+        dest="databases", action="append", type=pathlib.Path, metavar="PROFILE.db",
+        help="a profile database to build pages for, named after its file; may be repeated, and the trophy "
+             "definitions are read from the first (default: trophies.db and every profiles/*.db)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache", action="store_false",
+        help=f"re-render every page, ignoring (and not updating) {CACHE_FILE.relative_to(HERE)}"
+    )
+    parser.add_argument(
+        "--trace",
+        type=pathlib.Path, metavar="OUT.json",
+        help="record a Chrome/Perfetto trace of the build to this file and print a summary"
+    )
+
+    args = parser.parse_args(argv)
+    if args.databases is None:
+        args.databases = default_databases()
+
+    names = [profile_name(db) for db in args.databases]
+    for name in set(names):
+        if names.count(name) > 1:
+            parser.error(f"more than one database for the profile {name!r}")
+        if page_name(name) == COMPARE_PAGE:
+            parser.error(f"the profile {name!r} would overwrite the comparison page {COMPARE_PAGE}")
+
+    return args
+
+
+def main(argv=None):
+    args = parse_command_line(argv)
+
+    with tracing.session(args.trace):
+        with tracing.span("icons"):
+            output.write(ICON_CSS, render_icon_css())
+
+        with tracing.span("load", profiles=len(args.databases)):
+            games, progress = load_profiles(args.databases)
+
+        unknown = set(args.games) - {game["TableName"] for game in games}
+        if unknown:
+            sys.exit(f"Unknown game(s): {', '.join(sorted(unknown))} (expected one of "
+                     f"{', '.join(game['TableName'] for game in games)})")
+
+        cache = PageCache(CACHE_FILE, builder_version()) if args.use_cache else None
+
+        for game in games:
+            if args.games and game["TableName"] not in args.games:
+                continue
+
+            # (page, digest of its rows, the profiles it shows): one page per profile, plus the comparison
+            folder = HERE.parent / game["FolderName"]
+            pages = [(folder / page_name(name), page_digest(game, [progress[name]]), [name]) for name in progress]
+            if len(progress) > 1:
+                pages.append((folder / COMPARE_PAGE, page_digest(game, list(progress.values())), list(progress)))
+
+            stale = [page for page in pages if cache is None or not cache.fresh(page[0], page[1])]
+            # Trophy objects are only built for the profiles whose pages need rendering
+            data = {name: with_progress(game, progress[name]) for _, _, names in stale for name in names}
+
+            for path, digest, names in stale:
+                with tracing.span(f"render {path.relative_to(HERE.parent)}"):
+                    if len(names) == 1:
+                        page = render_game(data[names[0]])
+                    else:
+                        page = render_comparison(game, {name: data[name] for name in names})
+
+                output.write(path, page)
+                if cache is not None:
+                    cache.put(path, digest, page)
+
+            # remove the pages of profiles that are no longer built, and the comparison once only one is left
+            keep = {path.name for path, _, _ in pages}
+            for stale in folder.glob("trophies-*.html"):
+                if stale.name not in keep:
+                    stale.unlink()
+
+        if cache is not None:
+            cache.save()
+            print(f"{cache.hits + cache.misses} pages ({cache.hits} unchanged, {cache.misses} rendered)")
+
+    print(output.summary())
+
+
+if __name__ == "__main__":
+    main()